@@ -1,15 +1,30 @@
 
+import os
 import tkinter as tk
 
 from models import DataModel
-from views import MainView
+from utils import config
 from utils.config import (
-    DATA_FILE, EXPENSE_DATA_FILE,
     BUDGET_CATEGORIES, EXPENSE_CATEGORIES,
     CURRENCIES, SALARY_CATEGORY,
     DISTRIBUTABLE_CATEGORY, TRANSFER_OUT_CATEGORY,
 )
-from utils.helpers import set_currency_state, convert_currency, set_exchange_rates, format_currency
+from utils.helpers import (
+    set_currency_state, convert_currency, set_exchange_rates, format_currency,
+    export_to_excel,
+)
+
+
+# Categories left out of the headline totals, built once for every redraw
+_EXCLUDE_DISTRIBUTABLE = frozenset((DISTRIBUTABLE_CATEGORY,))
+_EXCLUDE_TRANSFER_OUT = frozenset((TRANSFER_OUT_CATEGORY,))
+
+
+def _maybe_convert(amount, input_currency, main_currency):
+    """Return (converted, original_currency, original_amount) for an entered amount."""
+    if not input_currency or input_currency == main_currency:
+        return amount, None, None
+    return convert_currency(amount, input_currency, main_currency), input_currency, amount
 
 
 class MainController:
@@ -18,13 +33,22 @@ class MainController:
     def __init__(self):
         self.root = tk.Tk()
 
+        # (symbol, suffix) per currency code, resolved once
+        self._currency_cache = {
+            code: (cur['symbol'], cur['suffix']) for code, cur in CURRENCIES.items()
+        }
+
         # ── Savings model ────────────────────────────────────────────
-        self.model = DataModel(DATA_FILE, BUDGET_CATEGORIES)
+        # Data paths are read from config here, not imported, so the data
+        # directory is only resolved (and created) once the window exists
+        self.model = DataModel(config.DATA_FILE, BUDGET_CATEGORIES)
+        self.model.set_scheduler(self.root)
         self._apply_currency_state(self.model.currency)
         set_exchange_rates(self.model.exchange_rates)
 
         # ── Expenses model ───────────────────────────────────────────
-        self.expenses_model = DataModel(EXPENSE_DATA_FILE, EXPENSE_CATEGORIES)
+        self.expenses_model = DataModel(config.EXPENSE_DATA_FILE, EXPENSE_CATEGORIES)
+        self.expenses_model.set_scheduler(self.root)
         # Sync currency to savings on first run (or if files drifted)
         if self.expenses_model.currency != self.model.currency:
             self.expenses_model.convert_all_amounts(
@@ -32,47 +56,60 @@ class MainController:
             )
             self.expenses_model.set_currency(self.model.currency)
 
+        # View refreshes requested during an action, flushed once when Tk is idle
+        self._dirty = set()
+        self._flush_scheduled = False
+
+        # Imported only once the data is loaded; pulls in the widget modules
+        from views import MainView
         self.view = MainView(self.root)
         self._setup_callbacks()
         self._initialize_view()
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
 
     # ── Callback wiring ──────────────────────────────────────────────
 
-    def _setup_callbacks(self):
+    # (view callback attribute, controller method)
+    _CALLBACK_MAP = (
         # Savings
-        self.view.on_add_budget      = self.add_to_budget
-        self.view.on_spend_budget    = self.spend_from_budget
-        self.view.on_clear_data      = self.clear_data
-        self.view.on_clear_category  = self.clear_category
-        self.view.on_create_category = self.create_category
-        self.view.on_export_data     = self.export_data
-        self.view.on_delete_category = self.delete_category
-        self.view.on_currency_change = self.change_currency
-        self.view.on_edit_rates      = self.open_rates_dialog
-
+        ('on_add_budget',                 'add_to_budget'),
+        ('on_spend_budget',               'spend_from_budget'),
+        ('on_clear_data',                 'clear_data'),
+        ('on_clear_category',             'clear_category'),
+        ('on_create_category',            'create_category'),
+        ('on_export_data',                'export_data'),
+        ('on_delete_category',            'delete_category'),
+        ('on_currency_change',            'change_currency'),
+        ('on_edit_rates',                 'open_rates_dialog'),
         # Expenses
-        self.view.on_add_expense             = self.add_to_expense
-        self.view.on_spend_expense           = self.spend_from_expense
-        self.view.on_clear_expense_data      = self.clear_expense_data
-        self.view.on_clear_expense_category  = self.clear_expense_category
-        self.view.on_create_expense_category = self.create_expense_category
-        self.view.on_export_expense_data     = self.export_expense_data
-        self.view.on_delete_expense_category = self.delete_expense_category
-        self.view.on_transfer_to_savings     = self.transfer_to_savings
-        self.view.on_add_direct_income       = self.add_direct_income
-        self.view.on_edit_direct_income      = self.edit_direct_income
-        self.view.on_delete_direct_income    = self.delete_direct_income
-        self.view.on_edit_income             = self.edit_income
-        self.view.on_delete_income           = self.delete_income
-        self.view.on_add_savings_note_preset    = self.add_savings_note_preset
-        self.view.on_remove_savings_note_preset = self.remove_savings_note_preset
-        self.view.on_add_expense_note_preset    = self.add_expense_note_preset
-        self.view.on_remove_expense_note_preset = self.remove_expense_note_preset
-        self.view.on_edit_savings_transaction   = self.edit_savings_transaction
-        self.view.on_delete_savings_transaction = self.delete_savings_transaction
-        self.view.on_edit_expense_transaction   = self.edit_expense_transaction
-        self.view.on_delete_expense_transaction = self.delete_expense_transaction
-        self.view.on_return_to_expenses         = self.return_to_expenses
+        ('on_add_expense',                'add_to_expense'),
+        ('on_spend_expense',              'spend_from_expense'),
+        ('on_clear_expense_data',         'clear_expense_data'),
+        ('on_clear_expense_category',     'clear_expense_category'),
+        ('on_create_expense_category',    'create_expense_category'),
+        ('on_export_expense_data',        'export_expense_data'),
+        ('on_delete_expense_category',    'delete_expense_category'),
+        ('on_transfer_to_savings',        'transfer_to_savings'),
+        ('on_add_direct_income',          'add_direct_income'),
+        ('on_edit_direct_income',         'edit_direct_income'),
+        ('on_delete_direct_income',       'delete_direct_income'),
+        ('on_edit_income',                'edit_income'),
+        ('on_delete_income',              'delete_income'),
+        ('on_add_savings_note_preset',    'add_savings_note_preset'),
+        ('on_remove_savings_note_preset', 'remove_savings_note_preset'),
+        ('on_add_expense_note_preset',    'add_expense_note_preset'),
+        ('on_remove_expense_note_preset', 'remove_expense_note_preset'),
+        ('on_edit_savings_transaction',   'edit_savings_transaction'),
+        ('on_delete_savings_transaction', 'delete_savings_transaction'),
+        ('on_edit_expense_transaction',   'edit_expense_transaction'),
+        ('on_delete_expense_transaction', 'delete_expense_transaction'),
+        ('on_return_to_expenses',         'return_to_expenses'),
+        ('on_expenses_built',             '_initialize_expenses_view'),
+    )
+
+    def _setup_callbacks(self):
+        for attr, method in self._CALLBACK_MAP:
+            setattr(self.view, attr, getattr(self, method))
 
     def _initialize_view(self):
         self.view.set_currency(self.model.currency)
@@ -87,8 +124,14 @@ class MainController:
         self._update_all_category_balances()
         self._update_foreign_currency_display()
         self._update_distributable_balance()
+        self._update_income_list()
+        self._update_direct_income_display()
+
+        # ── Expenses tabs (built the first time the view is shown) ───
+        if self.view.expenses_built:
+            self._initialize_expenses_view()
 
-        # ── Expenses tabs ────────────────────────────────────────────
+    def _initialize_expenses_view(self):
         for category in self.expenses_model.categories:
             transactions = self.expenses_model.get_transactions_by_category(category)
             presets = self.expenses_model.get_preset_notes(category)
@@ -99,33 +142,82 @@ class MainController:
         self._update_expenses_foreign_currency_display()
         self._update_transferred_display()
         self._update_income_list()
-        self._update_direct_income_display()
 
-    # ── Savings helpers ──────────────────────────────────────────────
+    # ── Deferred view refresh ────────────────────────────────────────
+
+    # Flush order for dirty tokens → render methods
+    _RENDERERS = (
+        ('summary', '_render_summary'),
+        ('foreign', '_render_foreign_currency_display'),
+        ('distributable', '_render_distributable_balance'),
+        ('exp_summary', '_render_expenses_summary'),
+        ('exp_foreign', '_render_expenses_foreign_currency_display'),
+        ('transferred', '_render_transferred_display'),
+        ('income', '_render_income_list'),
+        ('direct_income', '_render_direct_income_display'),
+    )
+
+    def _mark_dirty(self, token: str):
+        self._dirty.add(token)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_updates)
+
+    def _flush_updates(self):
+        self._flush_scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        for token, render in self._RENDERERS:
+            if token in dirty:
+                getattr(self, render)()
 
     def _update_summary(self):
+        self._mark_dirty('summary')
+
+    def _update_foreign_currency_display(self):
+        self._mark_dirty('foreign')
+
+    def _update_distributable_balance(self):
+        self._mark_dirty('distributable')
+
+    def _update_expenses_summary(self):
+        self._mark_dirty('exp_summary')
+
+    def _update_expenses_foreign_currency_display(self):
+        self._mark_dirty('exp_foreign')
+
+    def _update_transferred_display(self):
+        self._mark_dirty('transferred')
+
+    def _update_income_list(self):
+        self._mark_dirty('income')
+
+    def _update_direct_income_display(self):
+        self._mark_dirty('direct_income')
+
+    # ── Savings helpers ──────────────────────────────────────────────
+
+    def _render_summary(self):
         self.view.update_summary(
-            self.model.get_total_budget(exclude_categories=[DISTRIBUTABLE_CATEGORY]),
-            self.model.get_total_added(exclude_categories=[DISTRIBUTABLE_CATEGORY]),
-            self.model.get_total_spent(exclude_categories=[DISTRIBUTABLE_CATEGORY]),
+            self.model.get_total_budget(exclude_categories=_EXCLUDE_DISTRIBUTABLE),
+            self.model.get_total_added(exclude_categories=_EXCLUDE_DISTRIBUTABLE),
+            self.model.get_total_spent(exclude_categories=_EXCLUDE_DISTRIBUTABLE),
         )
 
-    def _update_all_category_balances(self):
-        for cat in self.model.categories:
-            self.view.update_category(cat, self.model.get_category_balance(cat))
+    def _update_all_category_balances(self, balances=None):
+        """Push every savings category balance to the view (precomputed if given)."""
+        if balances is None:
+            balances = {cat: self.model.get_category_balance(cat) for cat in self.model.categories}
+        for cat, balance in balances.items():
+            self.view.update_category(cat, balance)
 
-    def _update_foreign_currency_display(self):
+    def _render_foreign_currency_display(self):
         self.view.update_foreign_currency_display(self.model.get_foreign_currency_totals())
 
     # ── Savings operations ───────────────────────────────────────────
 
     def add_to_budget(self, amount: float, category: str, input_currency: str = None):
         main_currency = self.model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, amount
-        else:
-            converted, orig_curr, orig_amt = amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(amount, input_currency, main_currency)
 
         available = self.model.get_distributable_balance()
         if converted > available:
@@ -155,11 +247,7 @@ class MainController:
 
     def spend_from_budget(self, amount: float, category: str, input_currency: str = None, note: str = ''):
         main_currency = self.model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, amount
-        else:
-            converted, orig_curr, orig_amt = amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(amount, input_currency, main_currency)
 
         balance = self.model.get_category_balance(category)
         if converted > balance:
@@ -219,15 +307,14 @@ class MainController:
             return False
 
     def export_data(self):
-        from utils.helpers import export_to_excel
         from tkinter import filedialog
-        import os
         path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
             filetypes=[("Excel files", "*.xlsx")],
             initialfile="savings_export.xlsx",
         )
         if path:
+            self.model.flush()
             export_to_excel(
                 transactions=self.model.transactions,
                 categories=self.model.categories,
@@ -248,22 +335,18 @@ class MainController:
 
     # ── Expenses helpers ─────────────────────────────────────────────
 
-    def _update_expenses_summary(self):
+    def _render_expenses_summary(self):
         self.view.update_expenses_summary(
             self.expenses_model.get_total_budget(),
-            self.expenses_model.get_total_added(exclude_categories=[TRANSFER_OUT_CATEGORY]),
-            self.expenses_model.get_total_spent(exclude_categories=[TRANSFER_OUT_CATEGORY]),
+            self.expenses_model.get_total_added(exclude_categories=_EXCLUDE_TRANSFER_OUT),
+            self.expenses_model.get_total_spent(exclude_categories=_EXCLUDE_TRANSFER_OUT),
         )
 
     def _update_all_expense_category_balances(self):
         for cat in self.expenses_model.categories:
-            spent = sum(
-                t.amount for t in self.expenses_model.get_transactions_by_category(cat)
-                if t.action == 'spend'
-            )
-            self.view.update_expense_category(cat, spent)
+            self.view.update_expense_category(cat, self.expenses_model.get_category_spent(cat))
 
-    def _update_expenses_foreign_currency_display(self):
+    def _render_expenses_foreign_currency_display(self):
         self.view.update_expenses_foreign_currency_display(
             self.expenses_model.get_foreign_currency_totals()
         )
@@ -273,11 +356,7 @@ class MainController:
     def add_to_expense(self, amount: float, category: str, input_currency: str = None):
         """Add income to the expense pot (salary or other income, stored under SALARY_CATEGORY)."""
         main_currency = self.expenses_model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, amount
-        else:
-            converted, orig_curr, orig_amt = amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(amount, input_currency, main_currency)
         self.expenses_model.add_transaction(
             amount=converted, action='add', category=category,
             original_currency=orig_curr, original_amount=orig_amt,
@@ -290,11 +369,7 @@ class MainController:
 
     def spend_from_expense(self, amount: float, category: str, input_currency: str = None, note: str = ''):
         main_currency = self.expenses_model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, amount
-        else:
-            converted, orig_curr, orig_amt = amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(amount, input_currency, main_currency)
 
         remaining = self.expenses_model.get_total_budget()
         if converted > remaining:
@@ -314,11 +389,9 @@ class MainController:
             note=note if note else None,
         )
         # Show total spent in this category (positive number)
-        spent = sum(
-            t.amount for t in self.expenses_model.get_transactions_by_category(category)
-            if t.action == 'spend'
+        self.view.update_expense_category(
+            category, self.expenses_model.get_category_spent(category), transaction
         )
-        self.view.update_expense_category(category, spent, transaction)
         self._update_expenses_summary()
         self._update_expenses_foreign_currency_display()
 
@@ -356,15 +429,14 @@ class MainController:
             return False
 
     def export_expense_data(self):
-        from utils.helpers import export_to_excel
         from tkinter import filedialog
-        import os
         path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
             filetypes=[("Excel files", "*.xlsx")],
             initialfile="expenses_export.xlsx",
         )
         if path:
+            self.expenses_model.flush()
             export_to_excel(
                 transactions=self.expenses_model.transactions,
                 categories=self.expenses_model.categories,
@@ -387,11 +459,7 @@ class MainController:
     def transfer_to_savings(self, amount: float, input_currency: str = None):
         """Move money from the Expenses pot into the Savings distributable pool."""
         main_currency = self.model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, amount
-        else:
-            converted, orig_curr, orig_amt = amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(amount, input_currency, main_currency)
 
         # Guard: don't allow transferring more than what's remaining in expenses
         remaining = self.expenses_model.get_total_budget()
@@ -430,22 +498,12 @@ class MainController:
     def return_to_expenses(self, amount: float, input_currency: str = None):
         """Return money from the Savings distributable pool back to the Expenses pot."""
         main_currency = self.model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, amount
-        else:
-            converted, orig_curr, orig_amt = amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(amount, input_currency, main_currency)
 
         distributable = self.model.get_distributable_balance()
 
         # Cap at net amount actually transferred from expenses (exclude Other Income)
-        net_transferred = sum(
-            t.amount for t in self.model.transactions
-            if t.category == DISTRIBUTABLE_CATEGORY and t.action == 'add' and t.note == '__transfer__'
-        ) - sum(
-            t.amount for t in self.model.transactions
-            if t.category == DISTRIBUTABLE_CATEGORY and t.action == 'spend' and t.note == '__transfer_back__'
-        )
+        net_transferred = self._get_net_transferred()
         max_returnable = min(distributable, net_transferred)
 
         if max_returnable <= 0:
@@ -482,11 +540,7 @@ class MainController:
     def add_direct_income(self, amount: float, input_currency: str = None):
         """Add income directly into the savings distributable pool (no expenses debit)."""
         main_currency = self.model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, amount
-        else:
-            converted, orig_curr, orig_amt = amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(amount, input_currency, main_currency)
         self.model.add_transaction(
             amount=converted, action='add', category=DISTRIBUTABLE_CATEGORY,
             original_currency=orig_curr, original_amount=orig_amt,
@@ -495,26 +549,22 @@ class MainController:
         self._update_distributable_balance()
         self._update_direct_income_display()
 
-    def _update_income_list(self):
+    def _render_income_list(self):
         self.view.update_income_list(
             self.expenses_model.get_transactions_by_category(SALARY_CATEGORY)
         )
 
-    def _update_direct_income_display(self):
+    def _render_direct_income_display(self):
         txns = [
-            t for t in self.model.transactions
-            if t.category == DISTRIBUTABLE_CATEGORY and t.action == 'add' and t.note != '__transfer__'
+            t for t in self.model.get_transactions_by_category(DISTRIBUTABLE_CATEGORY)
+            if t.action == 'add' and t.note != '__transfer__'
         ]
         self.view.update_direct_income_display(txns)
 
     def edit_direct_income(self, transaction, new_amount: float, input_currency: str = None):
         """Edit an Other Income (direct distributable) transaction."""
         main_currency = self.model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(new_amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, new_amount
-        else:
-            converted, orig_curr, orig_amt = new_amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(new_amount, input_currency, main_currency)
 
         # Guard: new amount must not make the distributable balance go negative
         distributable = self.model.get_distributable_balance()
@@ -569,18 +619,11 @@ class MainController:
         self.view.refresh_expense_category_note_presets(category, self.expenses_model.get_preset_notes(category))
 
     def _get_total_transferred(self) -> float:
-        return sum(
-            t.amount for t in self.expenses_model.transactions
-            if t.category == TRANSFER_OUT_CATEGORY and t.action == 'spend'
-        )
+        return self.expenses_model.get_category_spent(TRANSFER_OUT_CATEGORY)
 
     def edit_income(self, transaction, new_amount: float, input_currency: str = None):
         main_currency = self.expenses_model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(new_amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, new_amount
-        else:
-            converted, orig_curr, orig_amt = new_amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(new_amount, input_currency, main_currency)
 
         total_transferred = self._get_total_transferred()
         if total_transferred > 0 and converted < total_transferred:
@@ -616,11 +659,7 @@ class MainController:
 
     def edit_savings_transaction(self, transaction, category, new_amount, input_currency, new_note):
         main_currency = self.model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(new_amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, new_amount
-        else:
-            converted, orig_curr, orig_amt = new_amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(new_amount, input_currency, main_currency)
 
         old_amount = transaction.amount
         category_balance = self.model.get_category_balance(category)
@@ -641,8 +680,7 @@ class MainController:
                 self.view.show_message("Cannot Increase", f"Maximum allowed amount is {format_currency(max_allowed)}.", "warning")
                 return
 
-        transaction.note = new_note or None
-        self.model.update_transaction_amount(transaction, converted, orig_amt, orig_curr)
+        self.model.update_transaction_amount(transaction, converted, orig_amt, orig_curr, note=new_note or '')
         self._update_summary()
         self._update_distributable_balance()
         self._update_foreign_currency_display()
@@ -669,11 +707,7 @@ class MainController:
 
     def edit_expense_transaction(self, transaction, category, new_amount, input_currency, new_note):
         main_currency = self.expenses_model.currency
-        if input_currency and input_currency != main_currency:
-            converted = convert_currency(new_amount, input_currency, main_currency)
-            orig_curr, orig_amt = input_currency, new_amount
-        else:
-            converted, orig_curr, orig_amt = new_amount, None, None
+        converted, orig_curr, orig_amt = _maybe_convert(new_amount, input_currency, main_currency)
 
         old_amount = transaction.amount
         remaining = self.expenses_model.get_total_budget()
@@ -682,68 +716,60 @@ class MainController:
             self.view.show_message("Cannot Increase", f"Maximum allowed amount is {format_currency(max_allowed)}.", "warning")
             return
 
-        transaction.note = new_note or None
-        self.expenses_model.update_transaction_amount(transaction, converted, orig_amt, orig_curr)
+        self.expenses_model.update_transaction_amount(transaction, converted, orig_amt, orig_curr, note=new_note or '')
         self._update_expenses_summary()
         self._update_expenses_foreign_currency_display()
-        spent = sum(t.amount for t in self.expenses_model.get_transactions_by_category(category) if t.action == 'spend')
-        self.view.update_expense_category(category, spent)
+        self.view.update_expense_category(category, self.expenses_model.get_category_spent(category))
         self.view.refresh_expense_transactions(category, self.expenses_model.get_transactions_by_category(category))
 
     def delete_expense_transaction(self, transaction, category):
         self.expenses_model.delete_transaction_by_ref(transaction)
         self._update_expenses_summary()
         self._update_expenses_foreign_currency_display()
-        spent = sum(t.amount for t in self.expenses_model.get_transactions_by_category(category) if t.action == 'spend')
-        self.view.update_expense_category(category, spent)
+        self.view.update_expense_category(category, self.expenses_model.get_category_spent(category))
         self.view.refresh_expense_transactions(category, self.expenses_model.get_transactions_by_category(category))
 
     def _get_net_transferred(self) -> float:
         """Net amount transferred from Expenses to Savings (excluding Other Income, minus returns)."""
-        sent = sum(
-            t.amount for t in self.model.transactions
-            if t.category == DISTRIBUTABLE_CATEGORY and t.action == 'add' and t.note == '__transfer__'
-        )
-        returned = sum(
-            t.amount for t in self.model.transactions
-            if t.category == DISTRIBUTABLE_CATEGORY and t.action == 'spend' and t.note == '__transfer_back__'
-        )
+        sent = self.model.get_tagged_total(DISTRIBUTABLE_CATEGORY, 'add', '__transfer__')
+        returned = self.model.get_tagged_total(DISTRIBUTABLE_CATEGORY, 'spend', '__transfer_back__')
         return sent - returned
 
-    def _update_distributable_balance(self):
+    def _render_distributable_balance(self):
         distributable = self.model.get_distributable_balance()
         net_transferred = self._get_net_transferred()
         self.view.update_distributable_balance(distributable, net_transferred)
 
-    def _update_transferred_display(self):
-        sent = sum(
-            t.amount for t in self.expenses_model.transactions
-            if t.category == TRANSFER_OUT_CATEGORY and t.action == 'spend'
-        )
-        returned = sum(
-            t.amount for t in self.expenses_model.transactions
-            if t.category == TRANSFER_OUT_CATEGORY and t.action == 'add'
-        )
-        self.view.update_transferred_display(sent - returned)
+    def _render_transferred_display(self):
+        returned = self.expenses_model.get_category_added(TRANSFER_OUT_CATEGORY)
+        self.view.update_transferred_display(self._get_total_transferred() - returned)
 
     # ── Currency / Rates (affect both models) ────────────────────────
 
+    def _refresh_all_transaction_lists(self):
+        self.view.refresh_all(
+            {c: self.model.get_transactions_by_category(c) for c in self.model.categories},
+            {c: self.expenses_model.get_transactions_by_category(c) for c in self.expenses_model.categories},
+        )
+
     def _apply_currency_state(self, currency_code: str):
-        cur = CURRENCIES.get(currency_code, CURRENCIES['EUR'])
-        set_currency_state(cur['symbol'], cur['suffix'])
+        cache = self._currency_cache
+        set_currency_state(*cache.get(currency_code, cache['EUR']))
 
     def change_currency(self, currency_code: str):
         old_code = self.model.currency
         if old_code == currency_code:
             return
 
-        # Convert savings amounts
-        self.model.convert_all_amounts(old_code, currency_code)
-        self.model.set_currency(currency_code)
+        # Both files must agree on the currency, so write them now rather than on the timer
+        with self.model.batched_save(sync=True), self.expenses_model.batched_save(sync=True):
+            # Convert savings amounts
+            balances = self.model.convert_all_amounts(old_code, currency_code)
+            self.model.set_currency(currency_code)
 
-        # Convert expenses amounts
-        self.expenses_model.convert_all_amounts(old_code, currency_code)
-        self.expenses_model.set_currency(currency_code)
+            # Convert expenses amounts
+            self.expenses_model.convert_all_amounts(old_code, currency_code)
+            self.expenses_model.set_currency(currency_code)
 
         self._apply_currency_state(currency_code)
 
@@ -753,13 +779,10 @@ class MainController:
         self._update_summary()
         self._update_expenses_summary()
 
-        self._update_all_category_balances()
+        self._update_all_category_balances(balances)
         self._update_all_expense_category_balances()
 
-        for cat in self.model.categories:
-            self.view.refresh_all_transactions(cat, self.model.get_transactions_by_category(cat))
-        for cat in self.expenses_model.categories:
-            self.view.refresh_expense_transactions(cat, self.expenses_model.get_transactions_by_category(cat))
+        self._refresh_all_transaction_lists()
 
         self._update_foreign_currency_display()
         self._update_expenses_foreign_currency_display()
@@ -779,11 +802,14 @@ class MainController:
     def change_exchange_rates(self, rates: dict):
         set_exchange_rates(rates)
 
-        self.model.set_exchange_rates(rates)
-        self.model.recalculate_foreign_amounts()
+        # Rates and the amounts derived from them are written together, right away
+        with self.model.batched_save():
+            self.model.set_exchange_rates(rates)
+            self.model.recalculate_foreign_amounts()
 
-        self.expenses_model.set_exchange_rates(rates)
-        self.expenses_model.recalculate_foreign_amounts()
+        with self.expenses_model.batched_save():
+            self.expenses_model.set_exchange_rates(rates)
+            self.expenses_model.recalculate_foreign_amounts()
 
         self._update_summary()
         self._update_expenses_summary()
@@ -791,10 +817,7 @@ class MainController:
         self._update_all_category_balances()
         self._update_all_expense_category_balances()
 
-        for cat in self.model.categories:
-            self.view.refresh_all_transactions(cat, self.model.get_transactions_by_category(cat))
-        for cat in self.expenses_model.categories:
-            self.view.refresh_expense_transactions(cat, self.expenses_model.get_transactions_by_category(cat))
+        self._refresh_all_transaction_lists()
 
         self._update_foreign_currency_display()
         self._update_expenses_foreign_currency_display()
@@ -803,5 +826,16 @@ class MainController:
         self._update_income_list()
         self._update_direct_income_display()
 
+    def _flush_models(self, sync: bool = False):
+        self.model.flush(sync)
+        self.expenses_model.flush(sync)
+
+    def _on_close(self):
+        self._flush_models(sync=True)
+        self.root.destroy()
+
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._flush_models(sync=True)
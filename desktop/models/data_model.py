@@ -1,14 +1,53 @@
 
+import os
 import json
 import base64
+from sys import intern
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from utils.config import DEFAULT_CURRENCY, EXCHANGE_RATES as _DEFAULT_RATES
 
+try:
+    import orjson
+except ImportError:  # optional: faster snapshot and log (de)serialization
+    orjson = None
 
-@dataclass
+
+def _dumps(data) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes (no indentation or spacing)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw: bytes):
+    """Parse UTF-8 JSON bytes (orjson's decode error subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+# Returned for categories that have no transactions
+_EMPTY: tuple = ()
+
+# Delay before a deferred save is written to disk
+_SAVE_DELAY_MS = 500
+
+# Fold the transaction log into the snapshot on startup once it grows past this
+_LOG_COMPACT_LINES = 500
+
+
+def _index_of(items: list, item) -> int:
+    """Position of item in items by identity, or -1 if it isn't there."""
+    for i, x in enumerate(items):
+        if x is item:
+            return i
+    return -1
+
+
+@dataclass(slots=True)
 class Transaction:
     """Represents a single budget transaction."""
     amount: float
@@ -20,11 +59,29 @@ class Transaction:
     original_amount: Optional[float] = None   #
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            'amount': self.amount,
+            'action': self.action,
+            'category': self.category,
+            'timestamp': self.timestamp,
+            'note': self.note,
+            'original_currency': self.original_currency,
+            'original_amount': self.original_amount,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Transaction':
-        return cls(**data)
+        # Positional construction skips keyword binding on large loads; thousands
+        # of rows share a handful of actions/categories, so keep one string each
+        return cls(
+            data['amount'],
+            intern(data['action']),
+            intern(data['category']),
+            data['timestamp'],
+            data.get('note'),
+            data.get('original_currency'),
+            data.get('original_amount'),
+        )
 
 
 class DataModel:
@@ -34,25 +91,51 @@ class DataModel:
 
     def __init__(self, data_file: str = 'savings_data.json', categories: List[str] = None):
         self.data_file = Path(data_file)
+        # Append-only log of transactions added since the last full save
+        self._log_file = self.data_file.with_suffix('.jsonl')
+        self._log_seq = 0
+        self._log_lines = 0
+        self._log_handle = None   # opened on first append, closed when the log is folded in
         self.transactions: List[Transaction] = []
         self.categories = categories or []
         self.currency: str = DEFAULT_CURRENCY
         self.exchange_rates: dict = dict(_DEFAULT_RATES)
         self.preset_notes: Dict[str, List[str]] = {}
+        # Aggregates kept in sync with self.transactions (see recompute_aggregates)
+        self._added_by_cat: Dict[str, float] = {}
+        self._spent_by_cat: Dict[str, float] = {}
+        self._total_added: float = 0.0
+        self._total_spent: float = 0.0
+        self._foreign_totals: Dict[str, Dict[str, float]] = {}
+        self._foreign_counts: Dict[str, int] = {}
+        self._tagged_totals: Dict[tuple, float] = {}
+        # Per-category transaction lists, in the same order as self.transactions.
+        # Transactions are only ever appended with a datetime.now() timestamp and
+        # edits never move them, so each list is already oldest-first; views rely
+        # on this and never sort.
+        self._by_cat: Dict[str, List[Transaction]] = {}
+        # Deferred saving (see set_scheduler); without a scheduler saves write immediately
+        self._root = None
+        self._dirty = False
+        self._flush_scheduled = False
+        self._suspend_save = 0   # > 0 inside batched_save()
         self._load_data()
+        self._rebuild_index()
+        self.recompute_aggregates()
+        if self._dirty or self._log_lines > _LOG_COMPACT_LINES:
+            self._write_now()
 
     def _load_data(self) -> None:
-        """Load data from Base64-encoded JSON file if it exists."""
+        """Load the JSON snapshot if it exists, then replay the log."""
         if self.data_file.exists():
             try:
                 raw = self.data_file.read_bytes()
-                try:
-                    decoded = base64.b64decode(raw)
-                    json_str = decoded.decode('utf-8')
-                except Exception:
-                    # Fallback: file is still plain JSON 
-                    json_str = raw.decode('utf-8')
-                data = json.loads(json_str)
+                # Peek at the first byte rather than stripping a copy of the file
+                legacy = raw[:1] not in (b'{', b'[')
+                if legacy:
+                    # Older versions wrapped the JSON in Base64
+                    raw = base64.b64decode(raw)
+                data = _loads(raw)
                 self.transactions = [
                     Transaction.from_dict(t) for t in data.get('transactions', [])
                 ]
@@ -64,23 +147,208 @@ class DataModel:
                 self.currency = data.get('currency', DEFAULT_CURRENCY)
                 self.exchange_rates = data.get('exchange_rates', dict(_DEFAULT_RATES))
                 self.preset_notes = data.get('preset_notes', {})
-            except (json.JSONDecodeError, KeyError) as e:
+                self._log_seq = data.get('log_seq', 0)
+                # Rewrite legacy files as plain JSON once they have loaded cleanly
+                self._dirty = legacy
+            # ValueError covers bad JSON, bad Base64 and bad UTF-8;
+            # TypeError is a malformed field, e.g. a non-string category
+            except (ValueError, KeyError, TypeError) as e:
                 print(f"Error loading data: {e}. Starting with empty data.")
                 self.transactions = []
+                return
+        self._replay_log()
+
+    def _replay_log(self) -> None:
+        """Append logged transactions that are newer than the snapshot."""
+        try:
+            with open(self._log_file, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        snapshot_seq = self._log_seq
+        last = len(lines) - 1
+        for i, line in enumerate(lines):
+            try:
+                entry = _loads(line)
+            except ValueError:
+                if i == last:
+                    # Torn final write: cut it off so the next append starts a clean line
+                    lines = lines[:i]
+                    self._log_file.write_bytes(b''.join(lines))
+                    break
+                print(f"Skipping unreadable log line {i + 1}.")
+                continue
+            try:
+                seq = entry['seq']
+                if seq > snapshot_seq:
+                    self.transactions.append(Transaction.from_dict(entry['transaction']))
+            # Malformed entry (missing or mistyped field): skip it, keep the rest
+            except (KeyError, TypeError) as e:
+                print(f"Skipping malformed log line {i + 1}: {e}.")
+                continue
+            self._log_seq = max(self._log_seq, seq)
+        self._log_lines = len(lines)
+
+    def _append_to_log(self, transaction: Transaction) -> None:
+        """Persist one new transaction by appending a line to the log."""
+        self._log_seq += 1
+        line = _dumps({'seq': self._log_seq, 'transaction': transaction.to_dict()})
+        if self._log_handle is None:
+            self._log_handle = open(self._log_file, 'ab')
+        self._log_handle.write(line + b'\n')
+        # Hand the line to the OS right away so it survives the app crashing
+        self._log_handle.flush()
+        self._log_lines += 1
+
+    def _close_log(self) -> None:
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the per-category transaction index in one pass."""
+        by_cat: Dict[str, List[Transaction]] = {c: [] for c in self.categories}
+        for t in self.transactions:
+            bucket = by_cat.get(t.category)
+            if bucket is None:
+                bucket = by_cat[t.category] = []
+            bucket.append(t)
+        self._by_cat = by_cat
+
+    def recompute_aggregates(self) -> None:
+        """Rebuild all cached totals with a single pass over the transactions."""
+        self._added_by_cat = {}
+        self._spent_by_cat = {}
+        self._total_added = 0.0
+        self._total_spent = 0.0
+        self._foreign_totals = {}
+        self._foreign_counts = {}
+        self._tagged_totals = {}
+        apply = self._apply
+        for t in self.transactions:
+            apply(t, 1)
+
+    def _apply(self, t: Transaction, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one transaction's share of the cached totals."""
+        amount = sign * t.amount
+        if t.action == 'add':
+            self._added_by_cat[t.category] = self._added_by_cat.get(t.category, 0.0) + amount
+            self._total_added += amount
+        else:
+            self._spent_by_cat[t.category] = self._spent_by_cat.get(t.category, 0.0) + amount
+            self._total_spent += amount
+        if t.original_currency and t.original_amount is not None:
+            curr = t.original_currency
+            count = self._foreign_counts.get(curr, 0) + sign
+            if count:
+                totals = self._foreign_totals.get(curr)
+                if totals is None:
+                    totals = self._foreign_totals[curr] = {'added': 0.0, 'spent': 0.0}
+                totals['added' if t.action == 'add' else 'spent'] += sign * t.original_amount
+                self._foreign_counts[curr] = count
+            else:
+                # Last transaction in this currency: drop it rather than keep rounding dust
+                self._foreign_totals.pop(curr, None)
+                self._foreign_counts.pop(curr, None)
+        if t.note is not None:
+            key = (t.category, t.action, t.note)
+            self._tagged_totals[key] = self._tagged_totals.get(key, 0.0) + amount
+
+    def _shift_amount(self, t: Transaction, delta: float) -> None:
+        """Adjust the cached totals for a change of delta in t.amount."""
+        if t.action == 'add':
+            self._added_by_cat[t.category] += delta
+            self._total_added += delta
+        else:
+            self._spent_by_cat[t.category] += delta
+            self._total_spent += delta
+        if t.note is not None:
+            self._tagged_totals[(t.category, t.action, t.note)] += delta
+
+    def _scale_totals(self, ratio: float) -> None:
+        """Scale every cached main-currency total by ratio."""
+        for totals in (self._added_by_cat, self._spent_by_cat, self._tagged_totals):
+            for key in totals:
+                totals[key] *= ratio
+        self._total_added *= ratio
+        self._total_spent *= ratio
+
+    def _remove_category_totals(self, category: str) -> None:
+        """Subtract every transaction of a category from the cached totals."""
+        for t in self._by_cat.get(category, _EMPTY):
+            self._apply(t, -1)
+        self._drop_category_totals(category)
+
+    def _drop_category_totals(self, category: str) -> None:
+        """Forget the cached totals of a category that no longer has transactions."""
+        self._added_by_cat.pop(category, None)
+        self._spent_by_cat.pop(category, None)
+        for key in [k for k in self._tagged_totals if k[0] == category]:
+            del self._tagged_totals[key]
+
+    def set_scheduler(self, root) -> None:
+        """Coalesce saves into one write per burst using root.after()."""
+        self._root = root
 
     def save_data(self) -> None:
-        """Save all data to JSON file encoded as Base64."""
+        """Mark data as changed and schedule a write (immediate without a scheduler)."""
+        self._dirty = True
+        if self._suspend_save:
+            return
+        if self._root is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._root.after(_SAVE_DELAY_MS, self._flush_if_dirty)
+
+    @contextmanager
+    def batched_save(self, sync: bool = False):
+        """Group several changes into one write, made as the outermost block exits."""
+        self._suspend_save += 1
+        try:
+            yield self
+        finally:
+            self._suspend_save -= 1
+            if not self._suspend_save:
+                self.flush(sync)
+
+    def _flush_if_dirty(self) -> None:
+        self._flush_scheduled = False
+        self.flush()
+
+    def flush(self, sync: bool = False) -> None:
+        """Write pending changes to disk now.
+
+        With sync=True the new file is fsynced before it replaces the old one;
+        reserved for app exit and currency changes, not every edit.
+        """
+        if self._dirty:
+            self._write_now(sync)
+
+    def _write_now(self, sync: bool = False) -> None:
+        """Save all data to the JSON file and reset the log."""
+        self._dirty = False
         data = {
             'transactions': [t.to_dict() for t in self.transactions],
             'categories': self.categories,
             'currency': self.currency,
             'exchange_rates': self.exchange_rates,
             'preset_notes': self.preset_notes,
+            'log_seq': self._log_seq,
             'last_updated': datetime.now().isoformat()
         }
-        json_str = json.dumps(data, indent=2, ensure_ascii=False)
-        encoded = base64.b64encode(json_str.encode('utf-8'))
-        self.data_file.write_bytes(encoded)
+        # Write beside the target and swap it in, so a crash never leaves half a file
+        tmp = self.data_file.with_name(self.data_file.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(data))
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        tmp.replace(self.data_file)
+        # Everything up to log_seq is now in the snapshot
+        self._close_log()
+        self._log_file.unlink(missing_ok=True)
+        self._log_lines = 0
 
     def add_transaction(
         self,
@@ -91,10 +359,11 @@ class DataModel:
         original_currency: Optional[str] = None,
         original_amount: Optional[float] = None,
     ) -> Transaction:
-        """Add a new transaction and save to file."""
+        """Add a new transaction and append it to the log."""
+        category = intern(category)
         transaction = Transaction(
             amount=amount,
-            action=action,
+            action=intern(action),
             category=category,
             timestamp=datetime.now().isoformat(),
             note=note,
@@ -102,9 +371,39 @@ class DataModel:
             original_amount=original_amount,
         )
         self.transactions.append(transaction)
-        self.save_data()
+        self._by_cat.setdefault(category, []).append(transaction)
+        self._apply(transaction, 1)
+        self._append_to_log(transaction)
         return transaction
 
+    def add_transactions_bulk(self, rows: List[dict]) -> List[Transaction]:
+        """Add many transactions at once (e.g. from an import).
+
+        Each row holds ``amount``, ``action`` and ``category`` plus the optional
+        ``note``, ``original_currency`` and ``original_amount``. All rows share
+        one timestamp and are persisted with a single snapshot save rather than
+        one log line each.
+        """
+        now = datetime.now().isoformat()
+        added = []
+        for row in rows:
+            transaction = Transaction(
+                amount=row['amount'],
+                action=intern(row['action']),
+                category=intern(row['category']),
+                timestamp=now,
+                note=row.get('note'),
+                original_currency=row.get('original_currency'),
+                original_amount=row.get('original_amount'),
+            )
+            self.transactions.append(transaction)
+            self._by_cat.setdefault(transaction.category, []).append(transaction)
+            self._apply(transaction, 1)
+            added.append(transaction)
+        if added:
+            self.save_data()
+        return added
+
     def add_to_budget(self, amount: float, category: str,
                       original_currency: Optional[str] = None,
                       original_amount: Optional[float] = None) -> Transaction:
@@ -123,55 +422,60 @@ class DataModel:
 
     def get_category_balance(self, category: str) -> float:
         """Get current balance for a specific category."""
-        total = 0
-        for t in self.transactions:
-            if t.category == category:
-                if t.action == 'add':
-                    total += t.amount
-                else:  
-                    total -= t.amount
-        return total
+        return self._added_by_cat.get(category, 0.0) - self._spent_by_cat.get(category, 0.0)
+
+    def get_category_added(self, category: str) -> float:
+        """Get total money added to a specific category."""
+        return self._added_by_cat.get(category, 0.0)
+
+    def get_category_spent(self, category: str) -> float:
+        """Get total money spent from a specific category."""
+        return self._spent_by_cat.get(category, 0.0)
+
+    def get_tagged_total(self, category: str, action: str, note: str) -> float:
+        """Get the summed amount of transactions matching category, action and note."""
+        return self._tagged_totals.get((category, action, note), 0.0)
 
     def get_total_budget(self, exclude_categories=None) -> float:
         """Get total budget across all categories."""
-        total = 0
-        for t in self.transactions:
-            if exclude_categories and t.category in exclude_categories:
-                continue
-            if t.action == 'add':
-                total += t.amount
-            else:
-                total -= t.amount
-        return total
+        return self.get_total_added(exclude_categories) - self.get_total_spent(exclude_categories)
 
     def get_total_added(self, exclude_categories=None) -> float:
         """Get total money added across all categories."""
-        return sum(
-            t.amount for t in self.transactions
-            if t.action == 'add'
-            and (not exclude_categories or t.category not in exclude_categories)
-        )
+        if not exclude_categories:
+            return self._total_added
+        return sum(v for c, v in self._added_by_cat.items() if c not in exclude_categories)
 
     def get_total_spent(self, exclude_categories=None) -> float:
         """Get total money spent across all categories."""
-        return sum(
-            t.amount for t in self.transactions
-            if t.action == 'spend'
-            and (not exclude_categories or t.category not in exclude_categories)
-        )
+        if not exclude_categories:
+            return self._total_spent
+        return sum(v for c, v in self._spent_by_cat.items() if c not in exclude_categories)
 
     def get_transactions_by_category(self, category: str) -> List[Transaction]:
-        """Get all transactions for a specific category."""
-        return [t for t in self.transactions if t.category == category]
+        """Get all transactions for a specific category.
+
+        Returns the model's live per-category list, oldest first (insertion
+        order is timestamp order); callers must not mutate it.
+        """
+        return self._by_cat.get(category, _EMPTY)
 
     def clear_all_data(self) -> None:
         """Clear all transactions."""
         self.transactions = []
+        for bucket in self._by_cat.values():
+            bucket.clear()
+        self.recompute_aggregates()
         self.save_data()
 
     def clear_category(self, category: str) -> None:
         """Clear all transactions for a specific category."""
+        if not self._by_cat.get(category):
+            return
+        self._remove_category_totals(category)
         self.transactions = [t for t in self.transactions if t.category != category]
+        if category in self._by_cat:
+            self._by_cat[category].clear()
         self.save_data()
 
     def add_category(self, category_name: str) -> bool:
@@ -179,12 +483,15 @@ class DataModel:
         if category_name in self.categories:
             return False
         self.categories.append(category_name)
+        self._by_cat.setdefault(category_name, [])
         self.save_data()
         return True
     
     def delete_category(self, category: str) -> None:
         """Delete a category and all its transactions."""
+        self._remove_category_totals(category)
         self.transactions = [t for t in self.transactions if t.category != category]
+        self._by_cat.pop(category, None)
         if category in self.categories:
             self.categories.remove(category)
         self.preset_notes.pop(category, None)
@@ -214,51 +521,71 @@ class DataModel:
 
     def get_foreign_currency_totals(self) -> Dict[str, Dict[str, float]]:
         """Get added/spent totals for each non-main currency used as input."""
-        totals: Dict[str, Dict[str, float]] = {}
-        for t in self.transactions:
-            if t.original_currency and t.original_amount is not None:
-                curr = t.original_currency
-                if curr not in totals:
-                    totals[curr] = {'added': 0.0, 'spent': 0.0}
-                if t.action == 'add':
-                    totals[curr]['added'] += t.original_amount
-                else:
-                    totals[curr]['spent'] += t.original_amount
-        return totals
-
-    def convert_all_amounts(self, from_code: str, to_code: str) -> None:
-        """Re-convert every stored amount when the main currency changes."""
-        from utils.helpers import convert_currency
-        for t in self.transactions:
-            t.amount = convert_currency(t.amount, from_code, to_code)
-        self.save_data()
+        return {curr: dict(totals) for curr, totals in self._foreign_totals.items()}
+
+    def convert_all_amounts(self, from_code: str, to_code: str) -> Dict[str, float]:
+        """Re-convert every stored amount when the main currency changes.
+
+        Returns the converted balance of every category, so callers can
+        refresh their displays without asking for each one again.
+        """
+        from utils.helpers import get_conversion_ratio
+        if from_code != to_code:
+            ratio = get_conversion_ratio(from_code, to_code)
+            for t in self.transactions:
+                t.amount *= ratio
+            # Every amount moved by the same factor, so the cached totals can too
+            self._scale_totals(ratio)
+            self.save_data()
+        return {cat: self.get_category_balance(cat) for cat in self.categories}
 
     def recalculate_foreign_amounts(self) -> None:
         """Recompute main-currency amounts for foreign-input transactions using active rates."""
-        from utils.helpers import convert_currency
+        from utils.helpers import get_conversion_ratio
+        ratios: Dict[str, float] = {}
+        changed = False
         for t in self.transactions:
             if t.original_currency and t.original_amount is not None:
-                t.amount = convert_currency(t.original_amount, t.original_currency, self.currency)
-        self.save_data()
+                ratio = ratios.get(t.original_currency)
+                if ratio is None:
+                    ratio = ratios[t.original_currency] = get_conversion_ratio(t.original_currency, self.currency)
+                new_amount = t.original_amount * ratio
+                if new_amount != t.amount:
+                    self._shift_amount(t, new_amount - t.amount)
+                    t.amount = new_amount
+                    changed = True
+        if changed:
+            self.save_data()
 
     def set_exchange_rates(self, rates: dict) -> None:
         """Persist custom exchange rates."""
+        if rates == self.exchange_rates:
+            return
         self.exchange_rates = dict(rates)
         self.save_data()
 
     def set_currency(self, currency_code: str) -> None:
         """Set the active currency and persist it."""
+        if currency_code == self.currency:
+            return
         self.currency = currency_code
         self.save_data()
 
     def delete_transaction_by_ref(self, transaction: 'Transaction') -> bool:
         """Delete a specific transaction by object reference. Returns True if found."""
-        try:
-            self.transactions.remove(transaction)
-            self.save_data()
-            return True
-        except ValueError:
+        # Match by identity, not ==: rows from one bulk add share a timestamp,
+        # so two of them can compare equal while being different transactions
+        bucket = self._by_cat.get(transaction.category, [])
+        i = _index_of(bucket, transaction)
+        if i < 0:
             return False
+        del bucket[i]
+        del self.transactions[_index_of(self.transactions, transaction)]
+        self._apply(transaction, -1)
+        if not bucket:
+            self._drop_category_totals(transaction.category)
+        self.save_data()
+        return True
 
     def clear_category_tagged(self, category: str, tag: str) -> None:
         """Remove only transactions in category whose note matches tag."""
@@ -266,6 +593,16 @@ class DataModel:
             t for t in self.transactions
             if not (t.category == category and t.note == tag)
         ]
+        bucket = self._by_cat.get(category)
+        if bucket:
+            for t in bucket:
+                if t.note == tag:
+                    self._apply(t, -1)
+            self._tagged_totals.pop((category, 'add', tag), None)
+            self._tagged_totals.pop((category, 'spend', tag), None)
+            bucket[:] = [t for t in bucket if t.note != tag]
+            if not bucket:
+                self._drop_category_totals(category)
         self.save_data()
 
     def update_transaction_amount(
@@ -274,11 +611,19 @@ class DataModel:
         new_amount: float,
         new_original_amount: Optional[float] = None,
         new_original_currency: Optional[str] = None,
+        note: Optional[str] = None,
     ) -> None:
-        """Update the amount fields of an existing transaction in-place."""
+        """Update the amount fields (and note, unless None) of an existing transaction in-place.
+
+        Notes key the tagged totals, so they must change between the two _apply calls.
+        """
+        self._apply(transaction, -1)
         transaction.amount = new_amount
         transaction.original_amount = new_original_amount
         transaction.original_currency = new_original_currency
+        if note is not None:
+            transaction.note = note or None
+        self._apply(transaction, 1)
         self.save_data()
 
     def get_distributable_balance(self) -> float:
@@ -288,16 +633,7 @@ class DataModel:
         distributable = sum(DISTRIBUTABLE_CATEGORY adds) - sum(all other adds)
         """
         from utils.config import DISTRIBUTABLE_CATEGORY
-        transferred = sum(
-            t.amount for t in self.transactions
-            if t.category == DISTRIBUTABLE_CATEGORY and t.action == 'add'
-        )
-        returned = sum(
-            t.amount for t in self.transactions
-            if t.category == DISTRIBUTABLE_CATEGORY and t.action == 'spend'
-        )
-        allocated = sum(
-            t.amount for t in self.transactions
-            if t.category != DISTRIBUTABLE_CATEGORY and t.action == 'add'
-        )
+        transferred = self._added_by_cat.get(DISTRIBUTABLE_CATEGORY, 0.0)
+        returned = self._spent_by_cat.get(DISTRIBUTABLE_CATEGORY, 0.0)
+        allocated = self.get_total_added(exclude_categories=(DISTRIBUTABLE_CATEGORY,))
         return transferred - returned - allocated
\ No newline at end of file
@@ -1,10 +1,35 @@
 
 import tkinter as tk
+from datetime import datetime
 from tkinter import ttk
+from functools import lru_cache
 from typing import Callable, List, Optional
 
 from utils.config import COLORS, FONTS, PADDING, PRESET_AMOUNTS, CURRENCIES
-from utils.helpers import format_currency, format_currency_for_code
+from utils.helpers import format_currency, format_currency_for_code, get_currency_state, parse_amount
+
+
+@lru_cache(maxsize=None)
+def _preset_labels(currency_code: str) -> tuple:
+    """Preset button captions for a currency, shared by every panel."""
+    return tuple(format_currency_for_code(amount, currency_code) for amount in PRESET_AMOUNTS)
+
+
+@lru_cache(maxsize=1024)
+def _short_time(timestamp: str) -> str:
+    """'MM/DD HH:MM' for a stored ISO timestamp (the same rows are redrawn on every refresh)."""
+    return datetime.fromisoformat(timestamp).strftime('%m/%d %H:%M')
+
+
+@lru_cache(maxsize=1024)
+def _amount_text(action: str, amount: float, original_currency, original_amount, state) -> str:
+    """Signed amount caption for a transaction row under the given currency state."""
+    sign = '+' if action == 'add' else '-'
+    # Show original currency + converted amount when input currency differed
+    if original_currency is not None and original_amount is not None:
+        orig_str = format_currency_for_code(original_amount, original_currency)
+        return f"{sign}{orig_str} ({format_currency(amount, state)})"
+    return f"{sign}{format_currency(amount, state)}"
 
 
 class BudgetButtonPanel(ttk.Frame):
@@ -27,9 +52,15 @@ class BudgetButtonPanel(ttk.Frame):
         self.on_add_click = on_add_click
         self.on_spend_click = on_spend_click
         self._initial_currency = initial_currency
+        self._labels_currency = initial_currency  # currency the preset captions show
         self.show_add = show_add
         self.show_note = show_note
         self.preset_notes: list = list(preset_notes or [])
+        # Lowercased copies for the note filter, and the text the combobox
+        # values were last filtered by ('' = the full list)
+        self._preset_notes_lower = [n.lower() for n in self.preset_notes]
+        self._last_typed = ''
+        self._note_menu = None  # built on first right-click, rebuilt when presets change
         self.on_add_preset_note = on_add_preset_note
         self.on_remove_preset_note = on_remove_preset_note
         self._note_presets_frame = None
@@ -58,46 +89,49 @@ class BudgetButtonPanel(ttk.Frame):
         currency_combo.pack(side='left', padx=PADDING['small'])
         currency_combo.bind('<<ComboboxSelected>>', self._on_input_currency_changed)
 
+        # Most panels sit on notebook tabs that may never be opened; the add and
+        # spend sections are built the first time the panel is actually shown
+        self._sections_built = False
+        self.bind('<Map>', self._ensure_built)
+
+    def _ensure_built(self, event=None):
+        """Build the add and spend sections once, on first display."""
+        if self._sections_built:
+            return
+        self._sections_built = True
         if self.show_add:
-            # === ADD SECTION ===
-            ttk.Label(
-                self, text="➕ Add to Budget",
-                font=FONTS['heading'], foreground=COLORS['add']
-            ).pack(anchor='w', pady=(0, PADDING['small']))
-
-            add_buttons_frame = ttk.Frame(self)
-            add_buttons_frame.pack(fill='x', pady=PADDING['small'])
-
-            for i, amount in enumerate(PRESET_AMOUNTS):
-                btn = tk.Button(
-                    add_buttons_frame,
-                    text=format_currency_for_code(amount, self._initial_currency),
-                    font=FONTS['button'],
-                    bg=COLORS['add'], fg='white',
-                    activebackground=COLORS['add_hover'], activeforeground='white',
-                    relief='flat', cursor='hand2',
-                    command=lambda a=amount: self.on_add_click(a, self.input_currency_var.get())
-                )
-                btn.pack(side='left', padx=(0 if i == 0 else PADDING['small'], 0), expand=True, fill='x')
-                self.add_preset_buttons.append(btn)
-
-            add_custom_frame = ttk.Frame(self)
-            add_custom_frame.pack(fill='x', pady=PADDING['small'])
-            ttk.Label(add_custom_frame, text="Custom:", font=FONTS['body']).pack(side='left')
-            self.add_entry = ttk.Entry(add_custom_frame, width=12, font=FONTS['body'])
-            self.add_entry.pack(side='left', padx=PADDING['small'])
-            self.add_entry.bind('<Return>', lambda e: self._on_custom_add())
-            tk.Button(
-                add_custom_frame, text="Add",
-                font=FONTS['button'], bg=COLORS['add'], fg='white',
-                activebackground=COLORS['add_hover'], activeforeground='white',
-                relief='flat', cursor='hand2', command=self._on_custom_add
-            ).pack(side='left', padx=PADDING['small'])
-
-            # Separator between add and spend sections
-            ttk.Separator(self, orient='horizontal').pack(fill='x', pady=PADDING['medium'])
-
-        # === SPEND SECTION ===
+            self._create_add_section()
+        self._create_spend_section()
+
+    def _create_add_section(self):
+        """Create the add preset buttons and custom amount row."""
+        ttk.Label(
+            self, text="➕ Add to Budget",
+            font=FONTS['heading'], foreground=COLORS['add']
+        ).pack(anchor='w', pady=(0, PADDING['small']))
+
+        self.add_preset_buttons = self._create_preset_buttons(
+            COLORS['add'], COLORS['add_hover'], self.on_add_click
+        )
+
+        add_custom_frame = ttk.Frame(self)
+        add_custom_frame.pack(fill='x', pady=PADDING['small'])
+        ttk.Label(add_custom_frame, text="Custom:", font=FONTS['body']).pack(side='left')
+        self.add_entry = ttk.Entry(add_custom_frame, width=12, font=FONTS['body'])
+        self.add_entry.pack(side='left', padx=PADDING['small'])
+        self.add_entry.bind('<Return>', lambda e: self._on_custom_add())
+        tk.Button(
+            add_custom_frame, text="Add",
+            font=FONTS['button'], bg=COLORS['add'], fg='white',
+            activebackground=COLORS['add_hover'], activeforeground='white',
+            relief='flat', cursor='hand2', command=self._on_custom_add
+        ).pack(side='left', padx=PADDING['small'])
+
+        # Separator between add and spend sections
+        ttk.Separator(self, orient='horizontal').pack(fill='x', pady=PADDING['medium'])
+
+    def _create_spend_section(self):
+        """Create the spend preset buttons, custom amount and note row."""
         spend_label = ttk.Label(
             self,
             text="➖ Spend from Budget",
@@ -107,24 +141,9 @@ class BudgetButtonPanel(ttk.Frame):
         spend_label.pack(anchor='w', pady=(0, PADDING['small']))
 
         # Spend preset buttons
-        spend_buttons_frame = ttk.Frame(self)
-        spend_buttons_frame.pack(fill='x', pady=PADDING['small'])
-
-        for i, amount in enumerate(PRESET_AMOUNTS):
-            btn = tk.Button(
-                spend_buttons_frame,
-                text=format_currency_for_code(amount, self._initial_currency),
-                font=FONTS['button'],
-                bg=COLORS['spend'],
-                fg='white',
-                activebackground=COLORS['spend_hover'],
-                activeforeground='white',
-                relief='flat',
-                cursor='hand2',
-                command=lambda a=amount: self.on_spend_click(a, self.input_currency_var.get())
-            )
-            btn.pack(side='left', padx=(0 if i == 0 else PADDING['small'], 0), expand=True, fill='x')
-            self.spend_preset_buttons.append(btn)
+        self.spend_preset_buttons = self._create_preset_buttons(
+            COLORS['spend'], COLORS['spend_hover'], self.on_spend_click
+        )
 
         # Spend custom amount
         spend_custom_frame = ttk.Frame(self)
@@ -159,17 +178,42 @@ class BudgetButtonPanel(ttk.Frame):
         )
         spend_btn.pack(side='left', padx=PADDING['small'])
 
+    def _create_preset_buttons(self, color: str, hover: str, on_click: Callable) -> list:
+        """Build one row of preset amount buttons, then lay it out in one pass."""
+        row = ttk.Frame(self)
+        currency_var = self.input_currency_var
+        style = dict(
+            font=FONTS['button'],
+            bg=color, fg='white',
+            activebackground=hover, activeforeground='white',
+            relief='flat', cursor='hand2',
+        )
+        buttons = [
+            tk.Button(row, text=label, command=lambda a=amount: on_click(a, currency_var.get()), **style)
+            for amount, label in zip(PRESET_AMOUNTS, _preset_labels(self._labels_currency))
+        ]
+        gap = PADDING['small']
+        for i, btn in enumerate(buttons):
+            btn.pack(side='left', padx=(0 if i == 0 else gap, 0), expand=True, fill='x')
+        # Pack the finished row last, so it joins the panel's layout only once
+        row.pack(fill='x', pady=PADDING['small'])
+        return buttons
+
     def _on_input_currency_changed(self, *args):
         """Update preset button labels when the input currency selector changes."""
-        currency = self.input_currency_var.get()
-        for btn, amount in zip(self.add_preset_buttons, PRESET_AMOUNTS):
-            btn.config(text=format_currency_for_code(amount, currency))
-        for btn, amount in zip(self.spend_preset_buttons, PRESET_AMOUNTS):
-            btn.config(text=format_currency_for_code(amount, currency))
+        code = self.input_currency_var.get()
+        if code == self._labels_currency:
+            # Re-picking the current entry still fires <<ComboboxSelected>>
+            return
+        self._labels_currency = code
+        labels = _preset_labels(code)
+        for btn, label in zip(self.add_preset_buttons, labels):
+            btn.config(text=label)
+        for btn, label in zip(self.spend_preset_buttons, labels):
+            btn.config(text=label)
 
     def _on_custom_add(self):
         """Handle custom add amount."""
-        from utils.helpers import parse_amount
         amount = parse_amount(self.add_entry.get())
         if amount is not None:
             self.on_add_click(amount, self.input_currency_var.get())
@@ -177,7 +221,6 @@ class BudgetButtonPanel(ttk.Frame):
 
     def _on_custom_spend(self):
         """Handle custom spend amount."""
-        from utils.helpers import parse_amount
         amount = parse_amount(self.spend_entry.get())
         if amount is not None:
             note = ''
@@ -203,17 +246,23 @@ class BudgetButtonPanel(ttk.Frame):
         """Show context menu listing all presets with remove options."""
         if not self.preset_notes or not self.on_remove_preset_note:
             return
-        menu = tk.Menu(self, tearoff=0)
-        for note in self.preset_notes:
-            menu.add_command(
-                label=f'Remove "{note}"',
-                command=lambda n=note: self.on_remove_preset_note(n),
-            )
-        menu.tk_popup(event.x_root, event.y_root)
+        if self._note_menu is None:
+            self._note_menu = tk.Menu(self, tearoff=0)
+            for note in self.preset_notes:
+                self._note_menu.add_command(
+                    label=f'Remove "{note}"',
+                    command=lambda n=note: self.on_remove_preset_note(n),
+                )
+        self._note_menu.tk_popup(event.x_root, event.y_root)
 
     def update_preset_notes(self, notes: List):
         """Update the preset notes list and rebuild the buttons."""
         self.preset_notes = list(notes)
+        self._preset_notes_lower = [n.lower() for n in self.preset_notes]
+        self._last_typed = ''
+        if self._note_menu is not None:
+            self._note_menu.destroy()
+            self._note_menu = None
         self._rebuild_note_presets()
         if hasattr(self, 'spend_note_entry'):
             self.spend_note_entry['values'] = self.preset_notes
@@ -223,7 +272,14 @@ class BudgetButtonPanel(ttk.Frame):
         if event.keysym in ('Return', 'Escape', 'Tab'):
             return
         typed = self.spend_note_entry.get().strip().lower()
-        filtered = [n for n in self.preset_notes if typed in n.lower()] if typed else list(self.preset_notes)
+        if typed == self._last_typed:
+            # Arrow keys, Shift etc. leave the text (and so the filter) unchanged
+            return
+        self._last_typed = typed
+        if typed:
+            filtered = [n for n, low in zip(self.preset_notes, self._preset_notes_lower) if typed in low]
+        else:
+            filtered = list(self.preset_notes)
         self.spend_note_entry['values'] = filtered
 
 
@@ -253,31 +309,56 @@ class SummaryCard(ttk.Frame):
             foreground=COLORS['text_secondary']
         ).pack(anchor='center')
 
+        self._shown_text = format_currency(self._value)
         self.value_label = ttk.Label(
             self,
-            text=format_currency(self._value),
+            text=self._shown_text,
             font=FONTS['amount'],
             foreground=self.color
         )
         self.value_label.pack(anchor='center')
 
+    def _render(self):
+        """Push the formatted value to the label, unless it already shows it."""
+        text = format_currency(self._value)
+        if text != self._shown_text:
+            self._shown_text = text
+            self.value_label.config(text=text)
+
     def update_value(self, new_value: float):
         """Update the displayed value."""
         self._value = new_value
-        self.value_label.config(text=format_currency(new_value))
+        self._render()
 
     def refresh_display(self):
         """Re-render the value label using the current currency symbol."""
-        self.value_label.config(text=format_currency(self._value))
+        self._render()
 
 
 class TransactionList(ttk.Frame):
     """Scrollable list of transactions."""
 
+    _WHEEL_SCALE = 1 / 120  # one unit per wheel notch
+    # Bind tag carried by every row widget of every list; bound once per Tk
+    # interpreter, so destroyed lists leave no bindings or callbacks behind
+    _ROW_TAG = 'TransactionRow'
+
     def __init__(self, parent, on_edit=None, on_delete=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.on_edit = on_edit
         self.on_delete = on_delete
+        # Row widgets are kept and re-labelled rather than destroyed on refresh;
+        # the first _shown rows of the pool are gridded, the rest grid_remove'd
+        self._rows: List[dict] = []
+        self._shown = 0
+        # One context menu per list; its commands act on _menu_transaction
+        self._menu: Optional[tk.Menu] = None
+        self._menu_transaction = None
+        # Row widgets share _ROW_TAG instead of binding right-click per label;
+        # the widget path identifies the row
+        self._row_by_widget: dict = {}
+        if (on_edit or on_delete) and not self.bind_class(self._ROW_TAG, '<Button-3>'):
+            self.bind_class(self._ROW_TAG, '<Button-3>', TransactionList._on_row_right_click)
         self._create_widgets()
 
     def _create_widgets(self):
@@ -286,9 +367,12 @@ class TransactionList(ttk.Frame):
         scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.canvas.yview)
         
         self.scrollable_frame = ttk.Frame(self.canvas)
+        self.scrollable_frame.columnconfigure(0, weight=1)
+        # The frame is the canvas's only item, anchored at the origin, so its
+        # new size is the scroll region; no need to ask the canvas for bbox('all')
         self.scrollable_frame.bind(
             '<Configure>',
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all'))
+            lambda e: self.canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor='nw')
@@ -297,77 +381,121 @@ class TransactionList(ttk.Frame):
         self.canvas.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
+        # The wheel is grabbed only while the pointer is over this list, so
+        # several lists don't all scroll on (and overwrite) one global binding
+        self.canvas.bind('<Enter>', self._bind_mousewheel)
+        self.canvas.bind('<Leave>', self._unbind_mousewheel)
+
+    def _bind_mousewheel(self, event=None):
+        """Route mousewheel events to this list."""
         self.canvas.bind_all('<MouseWheel>', self._on_mousewheel)
 
+    def _unbind_mousewheel(self, event):
+        """Release the mousewheel once the pointer leaves the list."""
+        # Moving onto a row also "leaves" the canvas; keep scrolling then
+        under = self.winfo_containing(event.x_root, event.y_root)
+        path = str(self.canvas)
+        if under is not None and (str(under) == path or str(under).startswith(path + '.')):
+            return
+        self.canvas.unbind_all('<MouseWheel>')
+
     def _on_mousewheel(self, event):
         """Handle mousewheel scrolling."""
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), 'units')
+        self.canvas.yview_scroll(int(-event.delta * self._WHEEL_SCALE), 'units')
 
     def clear(self):
-        """Clear all items from the list."""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        """Clear all items from the list (their widgets are kept for reuse)."""
+        self.set_items(())
+
+    def set_items(self, transactions):
+        """Show exactly these transactions, reusing existing row widgets."""
+        self._shown = 0
+        add_item = self.add_item
+        for transaction in transactions:
+            add_item(transaction)
+        for row in self._rows[self._shown:]:
+            if row['visible']:
+                row['frame'].grid_remove()
+                row['visible'] = False
 
     def add_item(self, transaction):
         """Add a transaction item to the list."""
-        item_frame = ttk.Frame(self.scrollable_frame)
-        item_frame.pack(fill='x', pady=2)
-
-        color = COLORS['add'] if transaction.action == 'add' else COLORS['spend']
-        sign = '+' if transaction.action == 'add' else '-'
-
-        # Show original currency + converted amount when input currency differed
-        has_foreign = (
-            getattr(transaction, 'original_currency', None) is not None
-            and getattr(transaction, 'original_amount', None) is not None
-        )
-        if has_foreign:
-            orig_str = format_currency_for_code(transaction.original_amount, transaction.original_currency)
-            main_str = format_currency(transaction.amount)
-            amount_text = f"{sign}{orig_str} ({main_str})"
+        if self._shown < len(self._rows):
+            row = self._rows[self._shown]
         else:
-            amount_text = f"{sign}{format_currency(transaction.amount)}"
+            row = self._create_row()
+            self._rows.append(row)
+        self._shown += 1
+        row['transaction'] = transaction
+        if not row['visible']:
+            row['frame'].grid()  # back into its own row, options remembered
+            row['visible'] = True
 
-        amount_label = ttk.Label(
-            item_frame,
-            text=amount_text,
-            font=FONTS['body'],
-            foreground=color
+        color = COLORS['add'] if transaction.action == 'add' else COLORS['spend']
+        # Keyed on the currency state too, so a currency switch re-renders
+        amount_text = _amount_text(
+            transaction.action, transaction.amount,
+            transaction.original_currency, transaction.original_amount,
+            get_currency_state(),
         )
-        amount_label.pack(side='left')
+        row['amount'].config(text=amount_text, foreground=color)
 
         # Note (if present)
         note = getattr(transaction, 'note', None)
         if note:
-            ttk.Label(
-                item_frame,
-                text=f"— {note}",
-                font=FONTS['body'],
-                foreground=COLORS['text_secondary'],
-            ).pack(side='left', padx=(PADDING['small'], 0))
+            row['note'].config(text=f"— {note}")
+            if not row['note_visible']:
+                row['note'].pack(side='left', padx=(PADDING['small'], 0), after=row['amount'])
+                row['note_visible'] = True
+        elif row['note_visible']:
+            row['note'].pack_forget()
+            row['note_visible'] = False
 
         # Timestamp
-        from datetime import datetime
-        dt = datetime.fromisoformat(transaction.timestamp)
-        time_str = dt.strftime('%m/%d %H:%M')
+        row['time'].config(text=_short_time(transaction.timestamp))
 
-        time_label = ttk.Label(
-            item_frame,
-            text=time_str,
-            font=FONTS['body'],
-            foreground=COLORS['text_secondary']
-        )
-        time_label.pack(side='right')
+    def _create_row(self) -> dict:
+        """Build the widgets for one list row; add_item fills them in."""
+        item_frame = ttk.Frame(self.scrollable_frame)
+        row = {
+            'frame': item_frame,
+            'amount': ttk.Label(item_frame, font=FONTS['body']),
+            'note': ttk.Label(item_frame, font=FONTS['body'], foreground=COLORS['text_secondary']),
+            'time': ttk.Label(item_frame, font=FONTS['body'], foreground=COLORS['text_secondary']),
+            'transaction': None,
+            'visible': True,
+            'note_visible': False,
+        }
+        # Each pooled frame owns a fixed grid row, so showing or hiding it
+        # never reorders its siblings
+        item_frame.grid(row=len(self._rows), column=0, sticky='ew', pady=2)
+        row['amount'].pack(side='left')
+        row['time'].pack(side='right')
 
         if self.on_edit or self.on_delete:
-            for widget in item_frame.winfo_children():
-                widget.bind('<Button-3>', lambda e, t=transaction: self._show_context_menu(e, t))
-            item_frame.bind('<Button-3>', lambda e, t=transaction: self._show_context_menu(e, t))
+            for widget in (item_frame, row['amount'], row['note'], row['time']):
+                widget.bindtags((self._ROW_TAG,) + widget.bindtags())
+                self._row_by_widget[str(widget)] = row
+        return row
+
+    @staticmethod
+    def _on_row_right_click(event):
+        """Open the owning list's context menu for whichever transaction the row shows now."""
+        owner = event.widget
+        while owner is not None and not isinstance(owner, TransactionList):
+            owner = owner.master
+        if owner is None:
+            return
+        row = owner._row_by_widget.get(str(event.widget))
+        if row is not None:
+            owner._show_context_menu(event, row['transaction'])
 
     def _show_context_menu(self, event, transaction):
-        menu = tk.Menu(self, tearoff=0)
-        if self.on_edit:
-            menu.add_command(label='Edit', command=lambda: self.on_edit(transaction))
-        if self.on_delete:
-            menu.add_command(label='Delete', command=lambda: self.on_delete(transaction))
-        menu.tk_popup(event.x_root, event.y_root)
\ No newline at end of file
+        if self._menu is None:
+            self._menu = tk.Menu(self, tearoff=0)
+            if self.on_edit:
+                self._menu.add_command(label='Edit', command=lambda: self.on_edit(self._menu_transaction))
+            if self.on_delete:
+                self._menu.add_command(label='Delete', command=lambda: self.on_delete(self._menu_transaction))
+        self._menu_transaction = transaction
+        self._menu.tk_popup(event.x_root, event.y_root)
\ No newline at end of file
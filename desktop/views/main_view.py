@@ -1,17 +1,29 @@
 
 import sys
 import tkinter as tk
+from contextlib import contextmanager
+from functools import lru_cache
 from tkinter import ttk, messagebox
 from pathlib import Path
 from typing import Callable, Dict, Optional
 
 from utils.config import (
     WINDOW_TITLE, WINDOW_SIZE, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
-    COLORS, FONTS, PADDING
+    COLORS, FONTS, PADDING, CURRENCIES, SALARY_CATEGORY,
 )
-from utils.helpers import format_currency
+from utils.helpers import format_currency, format_currency_for_code, parse_amount
 from .components import BudgetButtonPanel, SummaryCard, TransactionList
 
+# Bundled assets live next to the executable when frozen by PyInstaller
+_BASE_DIR = Path(sys._MEIPASS) if getattr(sys, 'frozen', False) else Path(__file__).parent.parent
+_ICON_PATH = _BASE_DIR / 'assets' / 'budget.ico'
+
+
+@lru_cache(maxsize=1)
+def _icon_file() -> Optional[str]:
+    """The window icon's path, or None when it isn't bundled; checked once per process."""
+    return str(_ICON_PATH) if _ICON_PATH.exists() else None
+
 
 class MainView:
     """Main application view for budget tracking."""
@@ -55,6 +67,16 @@ class MainView:
         self.on_edit_expense_transaction:   Optional[Callable] = None
         self.on_delete_expense_transaction: Optional[Callable] = None
         self.on_return_to_expenses:         Optional[Callable] = None
+        # Called once the expenses view has been built, to fill it in
+        self.on_expenses_built:             Optional[Callable] = None
+
+        # Nesting depth of batched_refresh(); list rebuilds are deferred while > 0
+        self._batch_depth = 0
+        # Notebook index of each "➕" tab; -1 until add_new_*_tab creates it
+        self.add_tab_index = -1
+        self.exp_add_tab_index = -1
+        # Latest income, for the salary bar's Edit/Delete; tracked before that bar exists
+        self._edit_income_transaction = None
 
         self._create_widgets()
 
@@ -62,38 +84,35 @@ class MainView:
 
     def _setup_window(self):
         self.root.title(WINDOW_TITLE)
-        self.root.geometry(WINDOW_SIZE)
+        # Size and centre in one geometry call; the screen size is known
+        # without forcing a layout pass first
+        w, h = map(int, WINDOW_SIZE.split('x'))
+        x = (self.root.winfo_screenwidth()  // 2) - (w // 2)
+        y = (self.root.winfo_screenheight() // 2) - (h // 2)
+        self.root.geometry(f"{w}x{h}+{x}+{y}")
         self.root.minsize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
         self.root.configure(bg=COLORS['background'])
 
-        if getattr(sys, 'frozen', False):
-            base = Path(sys._MEIPASS)
-        else:
-            base = Path(__file__).parent.parent
-        icon_path = base / 'assets' / 'budget.ico'
-        if icon_path.exists():
+        icon = _icon_file()
+        if icon:
             try:
-                self.root.iconbitmap(str(icon_path))
+                self.root.iconbitmap(icon)
             except Exception:
                 pass
 
-        self.root.update_idletasks()
-        w = self.root.winfo_width()
-        h = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth()  // 2) - (w // 2)
-        y = (self.root.winfo_screenheight() // 2) - (h // 2)
-        self.root.geometry(f"{w}x{h}+{x}+{y}")
-
     def _setup_styles(self):
         style = ttk.Style()
         style.theme_use('clam')
-        style.configure('TFrame',        background=COLORS['background'])
-        style.configure('Card.TFrame',   background=COLORS['card_bg'])
-        style.configure('TLabel',        background=COLORS['background'], foreground=COLORS['text_primary'])
-        style.configure('Card.TLabel',   background=COLORS['card_bg'])
-        style.configure('TNotebook',     background=COLORS['background'])
-        style.configure('TNotebook.Tab', padding=[20, 10], font=FONTS['body'])
-        style.configure('TButton',       font=FONTS['button'], padding=10)
+        # Applied as one Tcl script rather than a configure call per style
+        style.theme_settings('clam', {
+            'TFrame':        {'configure': {'background': COLORS['background']}},
+            'Card.TFrame':   {'configure': {'background': COLORS['card_bg']}},
+            'TLabel':        {'configure': {'background': COLORS['background'], 'foreground': COLORS['text_primary']}},
+            'Card.TLabel':   {'configure': {'background': COLORS['card_bg']}},
+            'TNotebook':     {'configure': {'background': COLORS['background']}},
+            'TNotebook.Tab': {'configure': {'padding': [20, 10], 'font': FONTS['body']}},
+            'TButton':       {'configure': {'font': FONTS['button'], 'padding': 10}},
+        })
 
     # ── Widget creation ──────────────────────────────────────────────
 
@@ -108,8 +127,11 @@ class MainView:
         self._create_savings_content(self.savings_frame)
 
         self.expenses_frame = ttk.Frame(main_container)
-        # Not packed initially — shown only when mode == 'expenses'
-        self._create_expenses_content(self.expenses_frame)
+        # Not packed initially — shown only when mode == 'expenses'. Its
+        # contents are built on the first switch; until then the expenses
+        # update methods below are no-ops
+        self.expenses_built = False
+        self.expenses_category_tabs: Dict[str, Dict] = {}
 
         self.active_mode = 'savings'
 
@@ -152,16 +174,17 @@ class MainView:
         )
 
         self.currency_var = tk.StringVar(value='EUR')
-        for code in ['EUR', 'SEK', 'USD']:
-            rb = tk.Radiobutton(
-                currency_frame, text=code,
-                variable=self.currency_var, value=code,
-                font=FONTS['button'],
-                bg=COLORS['background'], activebackground=COLORS['background'],
-                selectcolor=COLORS['background'],
-                cursor='hand2', command=self._on_currency_change,
+        bg = COLORS['background']
+        radio_style = dict(
+            variable=self.currency_var,
+            font=FONTS['button'],
+            bg=bg, activebackground=bg, selectcolor=bg,
+            cursor='hand2', command=self._on_currency_change,
+        )
+        for code in ('EUR', 'SEK', 'USD'):
+            tk.Radiobutton(currency_frame, text=code, value=code, **radio_style).pack(
+                side='left', padx=PADDING['small']
             )
-            rb.pack(side='left', padx=PADDING['small'])
 
         tk.Button(
             currency_frame, text="⚙ Rates",
@@ -181,6 +204,11 @@ class MainView:
             self._btn_savings.config(bg=COLORS['text_primary'])
             self._btn_expenses.config(bg=COLORS['text_secondary'])
         else:
+            if not self.expenses_built:
+                self._create_expenses_content(self.expenses_frame)
+                self.expenses_built = True
+                if self.on_expenses_built:
+                    self.on_expenses_built()
             self.savings_frame.pack_forget()
             self.expenses_frame.pack(fill='both', expand=True)
             self._btn_savings.config(bg=COLORS['text_secondary'])
@@ -217,6 +245,7 @@ class MainView:
         # Foreign currency row
         self.foreign_currency_frame = ttk.Frame(parent)
         self.foreign_currency_frame.pack(fill='x', pady=(0, PADDING['small']))
+        self._foreign_labels: Dict[str, ttk.Label] = {}
 
         # Distributable balance bar
         self._create_distributable_display(parent)
@@ -224,11 +253,11 @@ class MainView:
         # Notebook
         self.notebook = ttk.Notebook(parent)
         self.notebook.pack(fill='both', expand=True)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_notebook_tab_changed)
         self.category_tabs: Dict[str, Dict] = {}
 
     def _create_distributable_display(self, parent):
         """Colored banner showing how much transferred money is still free to allocate."""
-        from utils.config import CURRENCIES
         bar = tk.Frame(parent, bg='#eafaf1', relief='flat', bd=0)
         bar.pack(fill='x', pady=(0, PADDING['small']), ipady=6)
 
@@ -327,7 +356,7 @@ class MainView:
     def add_category_tab(self, category_name: str, transactions: list, insert_before_plus: bool = False, preset_notes: list = None):
         """Add a new savings category tab to the notebook."""
         tab_frame = ttk.Frame(self.notebook, padding=PADDING['medium'])
-        if insert_before_plus and hasattr(self, 'add_tab_index'):
+        if insert_before_plus and self.add_tab_index >= 0:
             self.notebook.insert(self.add_tab_index, tab_frame, text=category_name)
             self.add_tab_index += 1
         else:
@@ -394,22 +423,20 @@ class MainView:
             on_delete=lambda t, c=category_name: self._on_delete_transaction_click(t, c, is_expense=False),
         )
         tx_list.pack(fill='both', expand=True)
-        for t in reversed(transactions[-20:]):
-            tx_list.add_item(t)
 
-        self.category_tabs[category_name] = {
+        tab = self.category_tabs[category_name] = {
             'frame': tab_frame,
             'balance_label': balance_label,
             'available_label': available_label,
             'transaction_list': tx_list,
             'button_panel': panel,
         }
+        self._defer_initial_list(self.notebook, tab, transactions)
 
     # ── Transfer to Savings bar ──────────────────────────────────────
 
     def _create_transfer_bar(self, parent):
         """Bar in the Expenses view that lets the user push money into Savings."""
-        from utils.config import CURRENCIES
         bar = tk.Frame(parent, bg='#d6eaf8', relief='flat', bd=0)
         bar.pack(fill='x', pady=(0, PADDING['medium']), ipady=8)
 
@@ -460,7 +487,6 @@ class MainView:
         ).pack(side='right')
 
     def _on_transfer_click(self):
-        from utils.helpers import parse_amount
         amount = parse_amount(self.transfer_entry.get())
         if amount is None:
             self.show_message("Error", "Please enter a valid amount.", "error")
@@ -473,8 +499,6 @@ class MainView:
     # ── Salary input bar ─────────────────────────────────────────────
 
     def _create_salary_input(self, parent):
-        from utils.config import CURRENCIES
-        self._edit_income_transaction = None
         bar = tk.Frame(parent, bg=COLORS['card_bg'], relief='flat', bd=0)
         bar.pack(fill='x', pady=(0, PADDING['medium']), ipady=8)
 
@@ -536,8 +560,6 @@ class MainView:
         self._income_delete_btn.pack(side='left')
 
     def _on_salary_add(self):
-        from utils.helpers import parse_amount
-        from utils.config import SALARY_CATEGORY
         amount = parse_amount(self.salary_entry.get())
         if amount is None:
             self.show_message("Error", "Please enter a valid amount.", "error")
@@ -553,7 +575,6 @@ class MainView:
 
     def _on_edit_income_click(self, transaction):
         """Open a modal dialog to correct an income transaction's amount."""
-        from utils.config import CURRENCIES
         if transaction.original_currency and transaction.original_amount is not None:
             edit_currency = transaction.original_currency
             edit_amount   = transaction.original_amount
@@ -591,7 +612,6 @@ class MainView:
         ).pack(side='left', padx=PADDING['small'])
 
         def _save():
-            from utils.helpers import parse_amount
             new_amt = parse_amount(amount_entry.get())
             if new_amt is None:
                 self.show_message("Error", "Please enter a valid amount.", "error")
@@ -632,7 +652,6 @@ class MainView:
 
     def _on_edit_direct_income_click(self, transaction):
         """Open a modal dialog to correct an Other Income transaction."""
-        from utils.config import CURRENCIES
         if transaction.original_currency and transaction.original_amount is not None:
             edit_currency = transaction.original_currency
             edit_amount   = transaction.original_amount
@@ -670,7 +689,6 @@ class MainView:
         ).pack(side='left', padx=PADDING['small'])
 
         def _save():
-            from utils.helpers import parse_amount
             new_amt = parse_amount(amount_entry.get())
             if new_amt is None:
                 self.show_message("Error", "Please enter a valid amount.", "error")
@@ -706,7 +724,6 @@ class MainView:
     # ── Return to Expenses ───────────────────────────────────────────
 
     def _on_return_to_expenses_click(self):
-        from utils.config import CURRENCIES
         dialog = tk.Toplevel(self.root)
         dialog.title("Return to Expenses")
         dialog.resizable(False, False)
@@ -735,7 +752,6 @@ class MainView:
         ).pack(side='left', padx=PADDING['small'])
 
         def _save():
-            from utils.helpers import parse_amount
             amt = parse_amount(amount_entry.get())
             if amt is None:
                 self.show_message("Error", "Please enter a valid amount.", "error")
@@ -761,7 +777,6 @@ class MainView:
     # ── Transaction edit / delete ────────────────────────────────────
 
     def _on_edit_transaction_click(self, transaction, category, is_expense=False):
-        from utils.config import CURRENCIES
         if transaction.original_currency and transaction.original_amount is not None:
             edit_currency = transaction.original_currency
             edit_amount   = transaction.original_amount
@@ -811,7 +826,6 @@ class MainView:
             note_entry.pack(side='left', padx=PADDING['small'])
 
         def _save():
-            from utils.helpers import parse_amount
             new_amt = parse_amount(amount_entry.get())
             if new_amt is None:
                 self.show_message("Error", "Please enter a valid amount.", "error")
@@ -877,6 +891,7 @@ class MainView:
         # Foreign currency row
         self.exp_foreign_currency_frame = ttk.Frame(parent)
         self.exp_foreign_currency_frame.pack(fill='x', pady=(0, PADDING['small']))
+        self._exp_foreign_labels: Dict[str, ttk.Label] = {}
 
         # Salary / income quick-add bar with inline Edit / Delete
         self._create_salary_input(parent)
@@ -887,10 +902,12 @@ class MainView:
         # Notebook
         self.expenses_notebook = ttk.Notebook(parent)
         self.expenses_notebook.pack(fill='both', expand=True)
-        self.expenses_category_tabs: Dict[str, Dict] = {}
+        self.expenses_notebook.bind('<<NotebookTabChanged>>', self._on_notebook_tab_changed)
 
     def add_new_expense_category_tab(self):
         """Add the '+' tab for creating new expense categories."""
+        if not self.expenses_built:
+            return
         add_tab_frame = ttk.Frame(self.expenses_notebook, padding=PADDING['large'])
         self.expenses_notebook.add(add_tab_frame, text="  ➕  ")
         self._build_new_category_ui(
@@ -903,8 +920,10 @@ class MainView:
 
     def add_expense_category_tab(self, category_name: str, transactions: list, insert_before_plus: bool = False, preset_notes: list = None):
         """Add a new expense category tab to the expenses notebook."""
+        if not self.expenses_built:
+            return
         tab_frame = ttk.Frame(self.expenses_notebook, padding=PADDING['medium'])
-        if insert_before_plus and hasattr(self, 'exp_add_tab_index'):
+        if insert_before_plus and self.exp_add_tab_index >= 0:
             self.expenses_notebook.insert(self.exp_add_tab_index, tab_frame, text=category_name)
             self.exp_add_tab_index += 1
         else:
@@ -960,15 +979,80 @@ class MainView:
             on_delete=lambda t, c=category_name: self._on_delete_transaction_click(t, c, is_expense=True),
         )
         tx_list.pack(fill='both', expand=True)
-        for t in reversed(transactions[-20:]):
-            tx_list.add_item(t)
 
-        self.expenses_category_tabs[category_name] = {
+        tab = self.expenses_category_tabs[category_name] = {
             'frame': tab_frame,
             'balance_label': balance_label,
             'transaction_list': tx_list,
             'button_panel': exp_panel,
         }
+        self._defer_initial_list(self.expenses_notebook, tab, transactions)
+
+    # ── Batched list refresh ─────────────────────────────────────────
+
+    @contextmanager
+    def batched_refresh(self):
+        """Defer transaction-list rebuilds until the block exits.
+
+        On exit only the visible tab of each notebook is rebuilt; hidden tabs
+        are rebuilt the next time they are selected.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush_selected_tab(self.notebook, self.category_tabs)
+                if self.expenses_built:
+                    self._flush_selected_tab(self.expenses_notebook, self.expenses_category_tabs)
+
+    def refresh_all(self, savings: Dict[str, list], expenses: Dict[str, list]):
+        """Rebuild every savings and expense transaction list in one batched pass."""
+        with self.batched_refresh():
+            for category, transactions in savings.items():
+                self.refresh_all_transactions(category, transactions)
+            for category, transactions in expenses.items():
+                self.refresh_expense_transactions(category, transactions)
+
+    def _refresh_transaction_list(self, tab: Dict, transactions: list):
+        """Rebuild a tab's transaction list, or mark it stale while batching."""
+        if self._batch_depth:
+            tab['stale'] = transactions
+            return
+        tab.pop('stale', None)
+        tx_list = tab['transaction_list']
+        tx_list.set_items(reversed(transactions[-20:]))
+        tx_list.canvas.yview_moveto(0)
+
+    def _defer_initial_list(self, notebook, tab: Dict, transactions: list):
+        """Fill a new tab's list now if it is showing, else when first selected."""
+        if not transactions:
+            return
+        # Like batched refreshes, this relies on transactions being the
+        # model's live category list, so later additions are included
+        tab['stale'] = transactions
+        if notebook.select() == str(tab['frame']):
+            self._flush_stale(tab)
+
+    def _flush_stale(self, tab: Dict):
+        if 'stale' in tab:
+            self._refresh_transaction_list(tab, tab['stale'])
+
+    def _flush_selected_tab(self, notebook, tabs: Dict[str, Dict]):
+        selected = notebook.select()
+        for tab in tabs.values():
+            if str(tab['frame']) == selected:
+                self._flush_stale(tab)
+                break
+
+    def _on_notebook_tab_changed(self, event):
+        if self._batch_depth:
+            return
+        if event.widget is self.notebook:
+            self._flush_selected_tab(self.notebook, self.category_tabs)
+        else:
+            self._flush_selected_tab(self.expenses_notebook, self.expenses_category_tabs)
 
     # ── Shared helper ────────────────────────────────────────────────
 
@@ -1026,7 +1110,6 @@ class MainView:
             self.on_export_data()
 
     def _on_add_direct_income_click(self):
-        from utils.helpers import parse_amount
         amount = parse_amount(self._direct_income_entry.get())
         if amount is None:
             self.show_message("Error", "Please enter a valid amount.", "error")
@@ -1133,40 +1216,30 @@ class MainView:
         self.spent_card.update_value(spent)
 
     def update_foreign_currency_display(self, totals: dict):
-        from utils.helpers import format_currency_for_code
-        for w in self.foreign_currency_frame.winfo_children():
-            w.destroy()
-        if not totals:
-            return
-        ttk.Label(
-            self.foreign_currency_frame, text="Foreign Currency Activity:",
-            font=FONTS['body'], foreground=COLORS['text_secondary'],
-        ).pack(side='left', padx=(0, PADDING['medium']))
-        for code, data in totals.items():
-            net   = data['added'] - data['spent']
-            sign  = '+' if net >= 0 else '-'
-            color = COLORS['add'] if net >= 0 else COLORS['spend']
-            ttk.Label(
-                self.foreign_currency_frame,
-                text=f"{code}: {sign}{format_currency_for_code(abs(net), code)}",
-                font=FONTS['heading'], foreground=color,
-            ).pack(side='left', padx=(0, PADDING['large']))
+        self._update_foreign_labels(self.foreign_currency_frame, self._foreign_labels, totals)
 
     def update_category(self, category_name: str, balance: float, transaction=None):
         if category_name not in self.category_tabs:
             return
         tab = self.category_tabs[category_name]
-        tab['balance_label'].config(text=format_currency(balance))
+        self._set_balance_text(tab, format_currency(balance))
         if transaction:
-            tab['transaction_list'].add_item(transaction)
+            if 'stale' in tab:
+                # Stale lists are the model's live category lists, so the rebuild includes it
+                self._flush_stale(tab)
+            else:
+                tab['transaction_list'].add_item(transaction)
+
+    def _set_balance_text(self, tab: Dict, text: str):
+        """Update a tab's balance label, skipping the Tk call when it already shows text."""
+        if tab.get('balance_text') != text:
+            tab['balance_text'] = text
+            tab['balance_label'].config(text=text)
 
     def refresh_all_transactions(self, category_name: str, transactions: list):
         if category_name not in self.category_tabs:
             return
-        tab = self.category_tabs[category_name]
-        tab['transaction_list'].clear()
-        for t in reversed(transactions[-20:]):
-            tab['transaction_list'].add_item(t)
+        self._refresh_transaction_list(self.category_tabs[category_name], transactions)
 
     def select_tab(self, category_name: str):
         if category_name in self.category_tabs:
@@ -1177,7 +1250,7 @@ class MainView:
             return
         self.notebook.forget(self.category_tabs[category_name]['frame'])
         del self.category_tabs[category_name]
-        if hasattr(self, 'add_tab_index'):
+        if self.add_tab_index >= 0:
             self.add_tab_index -= 1
 
     def refresh_category_note_presets(self, category: str, notes: list):
@@ -1210,55 +1283,74 @@ class MainView:
 
     def update_transferred_display(self, amount: float):
         """Update the 'Total sent to Savings' label inside the transfer bar."""
+        if not self.expenses_built:
+            return
         self._transferred_label.config(text=format_currency(amount))
 
     # ── Expenses public API ──────────────────────────────────────────
 
     def refresh_expenses_summary_currency(self):
+        if not self.expenses_built:
+            return
         self.exp_total_card.refresh_display()
         self.exp_added_card.refresh_display()
         self.exp_spent_card.refresh_display()
 
     def update_expenses_summary(self, total: float, added: float, spent: float):
+        if not self.expenses_built:
+            return
         self.exp_total_card.update_value(total)
         self.exp_added_card.update_value(added)
         self.exp_spent_card.update_value(spent)
 
     def update_expenses_foreign_currency_display(self, totals: dict):
-        from utils.helpers import format_currency_for_code
-        for w in self.exp_foreign_currency_frame.winfo_children():
-            w.destroy()
-        if not totals:
+        if not self.expenses_built:
             return
-        ttk.Label(
-            self.exp_foreign_currency_frame, text="Foreign Currency Activity:",
-            font=FONTS['body'], foreground=COLORS['text_secondary'],
-        ).pack(side='left', padx=(0, PADDING['medium']))
+        self._update_foreign_labels(self.exp_foreign_currency_frame, self._exp_foreign_labels, totals)
+
+    def _update_foreign_labels(self, frame, labels: Dict[str, ttk.Label], totals: dict):
+        """Show net activity per foreign currency, relabelling existing labels in place.
+
+        Widgets are only rebuilt when the set (or order) of currencies changes.
+        """
+        if list(totals) != list(labels):
+            for w in frame.winfo_children():
+                w.destroy()
+            labels.clear()
+            if not totals:
+                return
+            ttk.Label(
+                frame, text="Foreign Currency Activity:",
+                font=FONTS['body'], foreground=COLORS['text_secondary'],
+            ).pack(side='left', padx=(0, PADDING['medium']))
+            for code in totals:
+                labels[code] = ttk.Label(frame, font=FONTS['heading'])
+                labels[code].pack(side='left', padx=(0, PADDING['large']))
         for code, data in totals.items():
             net   = data['added'] - data['spent']
             sign  = '+' if net >= 0 else '-'
             color = COLORS['add'] if net >= 0 else COLORS['spend']
-            ttk.Label(
-                self.exp_foreign_currency_frame,
+            labels[code].config(
                 text=f"{code}: {sign}{format_currency_for_code(abs(net), code)}",
-                font=FONTS['heading'], foreground=color,
-            ).pack(side='left', padx=(0, PADDING['large']))
+                foreground=color,
+            )
 
     def update_expense_category(self, category_name: str, balance: float, transaction=None):
         if category_name not in self.expenses_category_tabs:
             return
         tab = self.expenses_category_tabs[category_name]
-        tab['balance_label'].config(text=format_currency(balance))
+        self._set_balance_text(tab, format_currency(balance))
         if transaction:
-            tab['transaction_list'].add_item(transaction)
+            if 'stale' in tab:
+                # Stale lists are the model's live category lists, so the rebuild includes it
+                self._flush_stale(tab)
+            else:
+                tab['transaction_list'].add_item(transaction)
 
     def refresh_expense_transactions(self, category_name: str, transactions: list):
         if category_name not in self.expenses_category_tabs:
             return
-        tab = self.expenses_category_tabs[category_name]
-        tab['transaction_list'].clear()
-        for t in reversed(transactions[-20:]):
-            tab['transaction_list'].add_item(t)
+        self._refresh_transaction_list(self.expenses_category_tabs[category_name], transactions)
 
     def select_expense_tab(self, category_name: str):
         if category_name in self.expenses_category_tabs:
@@ -1269,13 +1361,12 @@ class MainView:
             return
         self.expenses_notebook.forget(self.expenses_category_tabs[category_name]['frame'])
         del self.expenses_category_tabs[category_name]
-        if hasattr(self, 'exp_add_tab_index'):
+        if self.exp_add_tab_index >= 0:
             self.exp_add_tab_index -= 1
 
     # ── Dialogs ──────────────────────────────────────────────────────
 
     def show_rates_dialog(self, current_rates: dict, default_rates: dict, on_save):
-        from utils.config import CURRENCIES
 
         dialog = tk.Toplevel(self.root)
         dialog.title("Exchange Rates")
@@ -1284,7 +1375,11 @@ class MainView:
 
         dialog.update_idletasks()
         w = 380
-        h = 60 + len([c for c in default_rates if c != 'EUR']) * 50 + 70
+        currencies = [
+            (code, CURRENCIES[code]['symbol'], default_rates[code])
+            for code in default_rates if code != 'EUR'
+        ]
+        h = 60 + len(currencies) * 50 + 70
         x = self.root.winfo_x() + (self.root.winfo_width()  - w) // 2
         y = self.root.winfo_y() + (self.root.winfo_height() - h) // 2
         dialog.geometry(f"{w}x{h}+{x}+{y}")
@@ -1296,22 +1391,20 @@ class MainView:
             anchor='w', pady=(0, PADDING['medium'])
         )
 
+        # One grid for all currency rows instead of a Frame per row
+        rows = ttk.Frame(frame)
+        rows.pack(fill='x')
         entries = {}
-        for code in default_rates:
-            if code == 'EUR':
-                continue
-            sym         = CURRENCIES[code]['symbol']
-            default_val = default_rates[code]
-            row = ttk.Frame(frame)
-            row.pack(fill='x', pady=(0, PADDING['small']))
-            ttk.Label(row, text="1 EUR =", font=FONTS['body']).pack(side='left')
-            entry = ttk.Entry(row, width=10, font=FONTS['body'])
+        pady = (0, PADDING['small'])
+        for i, (code, sym, default_val) in enumerate(currencies):
+            ttk.Label(rows, text="1 EUR =", font=FONTS['body']).grid(row=i, column=0, sticky='w', pady=pady)
+            entry = ttk.Entry(rows, width=10, font=FONTS['body'])
             entry.insert(0, str(current_rates.get(code, default_val)))
-            entry.pack(side='left', padx=PADDING['small'])
+            entry.grid(row=i, column=1, padx=PADDING['small'], pady=pady)
             ttk.Label(
-                row, text=f"{sym}    (default: {default_val})",
+                rows, text=f"{sym}    (default: {default_val})",
                 font=FONTS['body'], foreground=COLORS['text_secondary'],
-            ).pack(side='left')
+            ).grid(row=i, column=2, sticky='w', pady=pady)
             entries[code] = entry
 
         def _save():
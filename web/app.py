@@ -11,8 +11,8 @@ from supabase import create_client
 sys.path.insert(0, str(Path(__file__).parent))
 
 from models.data_model import DataModel
+from utils import config
 from utils.config import (
-    DATA_FILE, EXPENSE_DATA_FILE,
     BUDGET_CATEGORIES, EXPENSE_CATEGORIES,
     CURRENCIES, DISTRIBUTABLE_CATEGORY,
     SALARY_CATEGORY, TRANSFER_OUT_CATEGORY,
@@ -138,8 +138,9 @@ _handle_auth()
 # ── Load models once per user ─────────────────────────────────────
 @st.cache_resource
 def load_models(user_id: str):
-    model     = DataModel(DATA_FILE,         list(BUDGET_CATEGORIES), user_id=user_id)
-    exp_model = DataModel(EXPENSE_DATA_FILE, list(EXPENSE_CATEGORIES), user_id=user_id)
+    # Read the data paths here so the data directory is resolved after sign-in
+    model     = DataModel(config.DATA_FILE,         list(BUDGET_CATEGORIES), user_id=user_id)
+    exp_model = DataModel(config.EXPENSE_DATA_FILE, list(EXPENSE_CATEGORIES), user_id=user_id)
     return model, exp_model
 
 model, exp_model = load_models(st.session_state.user_id)
@@ -285,25 +285,26 @@ class DataModel:
         return total
 
     def get_total_budget(self, exclude_categories=None) -> float:
+        excl = frozenset(exclude_categories or ())
         total = 0
         for t in self.transactions:
-            if exclude_categories and t.category in exclude_categories:
+            if t.category in excl:
                 continue
             total += t.amount if t.action == 'add' else -t.amount
         return total
 
     def get_total_added(self, exclude_categories=None) -> float:
+        excl = frozenset(exclude_categories or ())
         return sum(
             t.amount for t in self.transactions
-            if t.action == 'add'
-            and (not exclude_categories or t.category not in exclude_categories)
+            if t.action == 'add' and t.category not in excl
         )
 
     def get_total_spent(self, exclude_categories=None) -> float:
+        excl = frozenset(exclude_categories or ())
         return sum(
             t.amount for t in self.transactions
-            if t.action == 'spend'
-            and (not exclude_categories or t.category not in exclude_categories)
+            if t.action == 'spend' and t.category not in excl
         )
 
     def get_transactions_by_category(self, category: str) -> List[Transaction]:
@@ -1,4 +1,5 @@
 from .config import *
+from . import config as _config
 from .helpers import format_currency, parse_amount, truncate_text, export_to_excel
 
 __all__ = [
@@ -15,4 +16,11 @@ __all__ = [
     'PADDING',
     'DATA_DIR',
     'DATA_FILE',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Data paths are resolved lazily by config; `import *` can't see them
+    if name in ('DATA_DIR', 'DATA_FILE', 'EXPENSE_DATA_FILE'):
+        return getattr(_config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
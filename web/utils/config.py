@@ -91,7 +91,21 @@ PADDING = {
     'large': 20,
 }
 
-# Data files - stored in data folder
-DATA_DIR = get_data_directory()
-DATA_FILE = str(DATA_DIR / 'savings_data.json')
-EXPENSE_DATA_FILE = str(DATA_DIR / 'expenses_data.json')
\ No newline at end of file
+# Data files - stored in data folder.
+# Resolved on first access (PEP 562) so importing config doesn't touch the disk.
+_DATA_FILE_NAMES = {
+    'DATA_FILE': 'savings_data.json',
+    'EXPENSE_DATA_FILE': 'expenses_data.json',
+}
+
+
+def __getattr__(name):
+    if name == 'DATA_DIR':
+        value = get_data_directory()
+    elif name in _DATA_FILE_NAMES:
+        data_dir = globals().get('DATA_DIR') or __getattr__('DATA_DIR')
+        value = str(data_dir / _DATA_FILE_NAMES[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -1,55 +1,84 @@
 from typing import Optional
 from pathlib import Path
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
+from dataclasses import dataclass
+from functools import lru_cache
 
+from utils.config import CURRENCIES, DEFAULT_CURRENCY, EXCHANGE_RATES
 
-_currency_state = {'symbol': '€', 'suffix': False}
+
+@dataclass(frozen=True)
+class CurrencyState:
+    """How amounts in the main currency are displayed."""
+    symbol: str
+    suffix: bool = False   # True → "12.00 kr", False → "€12.00"
+
+
+_currency_state = CurrencyState('€', False)
 _active_rates: dict = {}   # populated from model on startup; falls back to EXCHANGE_RATES
+_ratio_table: dict = {}    # (from_code, to_code) → multiplier, cleared whenever rates change
 
 
 def set_currency_state(symbol: str, suffix: bool) -> None:
     """Update the active currency used by format_currency."""
-    _currency_state['symbol'] = symbol
-    _currency_state['suffix'] = suffix
+    global _currency_state
+    _currency_state = CurrencyState(symbol, suffix)
+
+
+def get_currency_state() -> CurrencyState:
+    """Return the active currency state (immutable, safe to hold on to)."""
+    return _currency_state
 
 
 def set_exchange_rates(rates: dict) -> None:
     """Store the active exchange rates used by convert_currency."""
     _active_rates.clear()
     _active_rates.update(rates)
+    _ratio_table.clear()
+
 
+@lru_cache(maxsize=4096)
+def _format_amount(amount: float, symbol: str, suffix: bool) -> str:
+    """Format amount with symbol; cached since the same amounts are redrawn often."""
+    if suffix:
+        return f"{amount:,.2f} {symbol}"
+    return f"{symbol}{amount:,.2f}"
 
-def format_currency(amount: float) -> str:
-    """Format a number as currency string using the active currency."""
-    sym = _currency_state['symbol']
-    if _currency_state['suffix']:
-        return f"{amount:,.2f} {sym}"
-    return f"{sym}{amount:,.2f}"
+
+def format_currency(amount: float, state: Optional[CurrencyState] = None) -> str:
+    """Format a number as currency string using state, or the active currency."""
+    state = state or _currency_state
+    # + 0.0 turns -0.0 into 0.0, which would otherwise share its cache entry
+    return _format_amount(amount + 0.0, state.symbol, state.suffix)
 
 
 def format_currency_for_code(amount: float, currency_code: str) -> str:
     """Format amount in a specific currency without changing global state."""
-    from utils.config import CURRENCIES, DEFAULT_CURRENCY
     cur = CURRENCIES.get(currency_code, CURRENCIES[DEFAULT_CURRENCY])
-    symbol = cur['symbol']
-    if cur['suffix']:
-        return f"{amount:,.2f} {symbol}"
-    return f"{symbol}{amount:,.2f}"
+    return _format_amount(amount + 0.0, cur['symbol'], cur['suffix'])
+
+
+def _current_rates() -> dict:
+    """Active exchange rates, falling back to the configured defaults."""
+    if _active_rates:
+        return _active_rates
+    return EXCHANGE_RATES
+
+
+def get_conversion_ratio(from_code: str, to_code: str) -> float:
+    """Return the multiplier that converts from_code amounts into to_code."""
+    key = (from_code, to_code)
+    ratio = _ratio_table.get(key)
+    if ratio is None:
+        rates = _current_rates()
+        ratio = _ratio_table[key] = rates.get(to_code, 1.0) / rates.get(from_code, 1.0)
+    return ratio
 
 
 def convert_currency(amount: float, from_code: str, to_code: str) -> float:
     """Convert amount between currencies using active (or default) exchange rates."""
     if from_code == to_code:
         return amount
-    if _active_rates:
-        rates = _active_rates
-    else:
-        from utils.config import EXCHANGE_RATES
-        rates = EXCHANGE_RATES
-    from_rate = rates.get(from_code, 1.0)
-    to_rate = rates.get(to_code, 1.0)
-    return amount / from_rate * to_rate
+    return amount * get_conversion_ratio(from_code, to_code)
 
 
 def parse_amount(value: str) -> Optional[float]:
@@ -75,19 +104,21 @@ def truncate_text(text: str, max_length: int = 30) -> str:
     return text[:max_length - 3] + '...'
 
 def export_to_excel(transactions, categories, get_category_balance, get_totals, output_path: str, main_currency: str = 'EUR') -> str:
-    """Export transactions to a formatted Excel file."""
+    """Export transactions to a formatted Excel file.
+
+    The workbook is written in openpyxl's write-only mode. Column widths are
+    measured from the raw values while grouping, and the transaction rows are
+    generated one at a time as they are appended, so no sheet is ever held
+    as a full list of cell objects.
+    """
     from datetime import datetime
-    from utils.config import CURRENCIES
+    import openpyxl
     import openpyxl.utils
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 
-    wb = openpyxl.Workbook()
-    cur_sym = _currency_state['symbol']
-
-    # Detect foreign currencies used across all transactions (sorted for stable column order)
-    foreign_currencies = sorted(set(
-        t.original_currency for t in transactions
-        if t.original_currency and t.original_amount is not None
-    ))
+    wb = openpyxl.Workbook(write_only=True)
+    cur_sym = _currency_state.symbol
 
     # Shared styles
     header_fill = PatternFill("solid", start_color="2C3E50")
@@ -95,174 +126,238 @@ def export_to_excel(transactions, categories, get_category_balance, get_totals,
     add_fill    = PatternFill("solid", start_color="D5F5E3")
     spend_fill  = PatternFill("solid", start_color="FADBD8")
     total_fill  = PatternFill("solid", start_color="F0F0F0")
+    centered    = Alignment(horizontal="center")
+    bold_font   = Font(bold=True)
+    label_font  = Font(name="Segoe UI")
+    label_bold  = Font(bold=True, name="Segoe UI")
+    added_font  = Font(name="Segoe UI", color="27AE60")
+    spent_font  = Font(name="Segoe UI", color="E74C3C")
+    added_total = Font(bold=True, color="27AE60")
+    spent_total = Font(bold=True, color="E74C3C")
+
+    # Styles repeated on every header and transaction cell are registered once
+    # and assigned by name, instead of setting font and fill cell by cell
+    body_font = Font(name="Segoe UI", size=10)
+    for style in (
+        NamedStyle("Budget Header", font=header_font, fill=header_fill, alignment=centered),
+        NamedStyle("Budget Header Left", font=header_font, fill=header_fill),
+        NamedStyle("Budget Add", font=body_font, fill=add_fill),
+        NamedStyle("Budget Spend", font=body_font, fill=spend_fill),
+    ):
+        wb.add_named_style(style)
+
+    def styled(ws, value, font=None, fill=None, alignment=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    def named(ws, value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
+    def header_row(ws, headers, style="Budget Header"):
+        return [named(ws, h, style) for h in headers]
+
+    def measure(widths, values):
+        # Track the longest text per column from the raw values, before any cell exists
+        for col, value in enumerate(values):
+            length = len(str(value or ""))
+            if col == len(widths):
+                widths.append(length)
+            elif length > widths[col]:
+                widths[col] = length
+
+    def write_rows(ws, widths, rows):
+        # Write-only sheets can't be resized afterwards, so size columns first;
+        # rows may be a generator, so each one is built only as it is appended
+        for col, length in enumerate(widths, 1):
+            ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = min(length + 4, 40)
+        for row in rows:
+            ws.append(row)
+
+    # One pass: group by category and foreign currency, total per category,
+    # split each timestamp once for every sheet that shows it, and measure the
+    # column widths of the transaction sheets from the raw values
+    by_cat = {}
+    by_fc = {}
+    totals = {}      # category -> [added, spent]
+    fc_totals = {}   # (category, currency) -> [added, spent]
+    stamps = {}      # id(transaction) -> (date, time)
+    all_widths = []  # All Transactions columns
+    cat_widths = {}  # category -> columns of its sheet
+    fc_widths = {}   # currency -> columns of its sheet
+    for n, t in enumerate(transactions, 1):
+        dt = datetime.fromisoformat(t.timestamp)
+        day, clock = stamps[id(t)] = (dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S"))
+        by_cat.setdefault(t.category, []).append(t)
+        idx = 0 if t.action == "add" else 1
+        if t.action in ("add", "spend"):
+            totals.setdefault(t.category, [0, 0])[idx] += t.amount
+        action = t.action.capitalize()
+        amount = t.amount if t.action == "add" else -t.amount
+        note = t.note or ""
+        orig = (t.original_currency or "",
+                t.original_amount if t.original_amount is not None else "")
+        measure(all_widths, (n, day, clock, t.category, action, amount, note) + orig)
+        measure(cat_widths.setdefault(t.category, []), (day, clock, action, amount, note) + orig)
+        if t.original_currency and t.original_amount is not None:
+            fc_list = by_fc.setdefault(t.original_currency, [])
+            fc_list.append(t)
+            orig_amt = t.original_amount if t.action == "add" else -t.original_amount
+            measure(fc_widths.setdefault(t.original_currency, []),
+                    (len(fc_list), day, clock, t.category, action, orig_amt, amount, note))
+            if t.action in ("add", "spend"):
+                fc_totals.setdefault((t.category, t.original_currency), [0, 0])[idx] += t.original_amount
+
+    # Foreign currencies used across all transactions (sorted for stable column order)
+    foreign_currencies = sorted(by_fc)
 
     # ── Sheet 1: All Transactions ──────────────────────────────
-    ws = wb.active
-    ws.title = "All Transactions"
+    ws = wb.create_sheet(title="All Transactions")
 
     headers = ["#", "Date", "Time", "Category", "Action", f"Amount ({cur_sym})", "Note"]
     if foreign_currencies:
         headers += ["Orig. Currency", "Orig. Amount"]
 
-    for col, h in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=h)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center")
+    def all_rows():
+        yield header_row(ws, headers)
+        for i, t in enumerate(transactions, 1):
+            day, clock = stamps[id(t)]
+            row_style = "Budget Add" if t.action == "add" else "Budget Spend"
+            amount = t.amount if t.action == "add" else -t.amount
+            row = [i, day, clock,
+                   t.category, t.action.capitalize(), amount, t.note or ""]
+            if foreign_currencies:
+                row += [t.original_currency or "",
+                        t.original_amount if t.original_amount is not None else ""]
+            yield [named(ws, val, row_style) for val in row]
 
-    for i, t in enumerate(transactions, 1):
-        dt = datetime.fromisoformat(t.timestamp)
-        row_fill = add_fill if t.action == "add" else spend_fill
-        amount = t.amount if t.action == "add" else -t.amount
-        row = [i, dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S"),
-               t.category, t.action.capitalize(), amount, t.note or ""]
-        if foreign_currencies:
-            row += [t.original_currency or "",
-                    t.original_amount if t.original_amount is not None else ""]
-        for col, val in enumerate(row, 1):
-            cell = ws.cell(row=i + 1, column=col, value=val)
-            cell.fill = row_fill
-            cell.font = Font(name="Segoe UI", size=10)
+    measure(all_widths, headers)
+    write_rows(ws, all_widths[:len(headers)], all_rows())
 
     # ── Sheet 2: Summary (balances + totals + foreign currency columns) ─
     ws_summary = wb.create_sheet(title="Summary")
 
-    ws_summary["A1"] = "Budget Summary"
-    ws_summary["A1"].font = Font(bold=True, size=14, name="Segoe UI")
-
     # Build header row: fixed columns + one added/spent pair per foreign currency
     sum_headers = ["Category", f"Added ({cur_sym})", f"Spent ({cur_sym})", f"Balance ({cur_sym})"]
     for fc in foreign_currencies:
         fc_sym = CURRENCIES.get(fc, {}).get('symbol', fc)
         sum_headers += [f"Added ({fc_sym})", f"Spent ({fc_sym})"]
 
-    for col, h in enumerate(sum_headers, 1):
-        cell = ws_summary.cell(row=3, column=col, value=h)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center")
-
-    for row_i, cat in enumerate(categories, start=4):
-        cat_transactions = [t for t in transactions if t.category == cat]
-        added   = sum(t.amount for t in cat_transactions if t.action == "add")
-        spent   = sum(t.amount for t in cat_transactions if t.action == "spend")
+    rows = [
+        [styled(ws_summary, "Budget Summary", Font(bold=True, size=14, name="Segoe UI"))],
+        [],
+        header_row(ws_summary, sum_headers),
+    ]
+    for cat in categories:
+        added, spent = totals.get(cat, (0, 0))
         balance = get_category_balance(cat)
         b_fill  = add_fill if balance >= 0 else spend_fill
 
-        ws_summary.cell(row=row_i, column=1, value=cat).font = Font(name="Segoe UI")
-        ws_summary.cell(row=row_i, column=2, value=added).font = Font(name="Segoe UI", color="27AE60")
-        ws_summary.cell(row=row_i, column=3, value=spent).font = Font(name="Segoe UI", color="E74C3C")
-        cell = ws_summary.cell(row=row_i, column=4, value=balance)
-        cell.font = Font(bold=True, name="Segoe UI")
-        cell.fill = b_fill
-
-        for fi, fc in enumerate(foreign_currencies):
-            col = 5 + fi * 2
-            fc_added = sum(t.original_amount for t in cat_transactions
-                           if t.action == "add" and t.original_currency == fc
-                           and t.original_amount is not None)
-            fc_spent = sum(t.original_amount for t in cat_transactions
-                           if t.action == "spend" and t.original_currency == fc
-                           and t.original_amount is not None)
-            if fc_added > 0:
-                ws_summary.cell(row=row_i, column=col,     value=fc_added).font = Font(name="Segoe UI", color="27AE60")
-            if fc_spent > 0:
-                ws_summary.cell(row=row_i, column=col + 1, value=fc_spent).font = Font(name="Segoe UI", color="E74C3C")
+        row = [
+            styled(ws_summary, cat, label_font),
+            styled(ws_summary, added, added_font),
+            styled(ws_summary, spent, spent_font),
+            styled(ws_summary, balance, label_bold, b_fill),
+        ]
+        for fc in foreign_currencies:
+            fc_added, fc_spent = fc_totals.get((cat, fc), (0, 0))
+            row.append(styled(ws_summary, fc_added, added_font)
+                       if fc_added > 0 else None)
+            row.append(styled(ws_summary, fc_spent, spent_font)
+                       if fc_spent > 0 else None)
+        rows.append(row)
 
     # Totals row
     total_row = len(categories) + 4
-    ws_summary.cell(row=total_row, column=1, value="TOTAL").font = Font(bold=True, name="Segoe UI")
-    ws_summary.cell(row=total_row, column=2, value=f"=SUM(B4:B{total_row-1})").font = Font(bold=True, color="27AE60")
-    ws_summary.cell(row=total_row, column=3, value=f"=SUM(C4:C{total_row-1})").font = Font(bold=True, color="E74C3C")
-    ws_summary.cell(row=total_row, column=4, value=f"=SUM(D4:D{total_row-1})").font = Font(bold=True)
-    for col in range(1, 5):
-        ws_summary.cell(row=total_row, column=col).fill = total_fill
-
+    row = [
+        styled(ws_summary, "TOTAL", label_bold, total_fill),
+        styled(ws_summary, f"=SUM(B4:B{total_row-1})", added_total, total_fill),
+        styled(ws_summary, f"=SUM(C4:C{total_row-1})", spent_total, total_fill),
+        styled(ws_summary, f"=SUM(D4:D{total_row-1})", bold_font, total_fill),
+    ]
     for fi, fc in enumerate(foreign_currencies):
         col = 5 + fi * 2
         cl_add = openpyxl.utils.get_column_letter(col)
         cl_spe = openpyxl.utils.get_column_letter(col + 1)
-        cell_add = ws_summary.cell(row=total_row, column=col,
-                                   value=f"=SUM({cl_add}4:{cl_add}{total_row-1})")
-        cell_add.font = Font(bold=True, color="27AE60")
-        cell_add.fill = total_fill
-        cell_spe = ws_summary.cell(row=total_row, column=col + 1,
-                                   value=f"=SUM({cl_spe}4:{cl_spe}{total_row-1})")
-        cell_spe.font = Font(bold=True, color="E74C3C")
-        cell_spe.fill = total_fill
+        row.append(styled(ws_summary, f"=SUM({cl_add}4:{cl_add}{total_row-1})",
+                          added_total, total_fill))
+        row.append(styled(ws_summary, f"=SUM({cl_spe}4:{cl_spe}{total_row-1})",
+                          spent_total, total_fill))
+    rows.append(row)
+    # One row per category, so this sheet is small enough to measure from its cells
+    sum_widths = []
+    for row in rows:
+        measure(sum_widths, [c.value if hasattr(c, 'value') else c for c in row])
+    write_rows(ws_summary, sum_widths, rows)
 
     # ── Sheet 3+: Per-category transaction sheets ──────────────
+    def category_rows(ws_cat, cat_headers, cat_transactions, cat_foreign, total):
+        yield header_row(ws_cat, cat_headers, "Budget Header Left")
+        for t in cat_transactions:
+            day, clock = stamps[id(t)]
+            amt = t.amount if t.action == "add" else -t.amount
+            row = [day, clock,
+                   t.action.capitalize(), amt, t.note or ""]
+            if cat_foreign:
+                row += [t.original_currency or "",
+                        t.original_amount if t.original_amount is not None else ""]
+            yield row
+        yield [None, None, styled(ws_cat, "TOTAL", bold_font),
+               styled(ws_cat, total, bold_font)]
+
     for cat in categories:
         ws_cat = wb.create_sheet(title=cat[:31])
-        cat_transactions = [x for x in transactions if x.category == cat]
+        cat_transactions = by_cat.get(cat, ())
 
         # Foreign currencies used specifically in this category
-        cat_foreign = sorted(set(
-            t.original_currency for t in cat_transactions
-            if t.original_currency and t.original_amount is not None
-        ))
+        cat_foreign = any(
+            t.original_currency and t.original_amount is not None
+            for t in cat_transactions
+        )
 
         cat_headers = ["Date", "Time", "Action", f"Amount ({cur_sym})", "Note"]
         if cat_foreign:
             cat_headers += ["Orig. Currency", "Orig. Amount"]
 
-        ws_cat.append(cat_headers)
-        for cell in ws_cat[1]:
-            cell.fill = header_fill
-            cell.font = header_font
-
-        for t in cat_transactions:
-            dt  = datetime.fromisoformat(t.timestamp)
-            amt = t.amount if t.action == "add" else -t.amount
-            row = [dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S"),
-                   t.action.capitalize(), amt, t.note or ""]
-            if cat_foreign:
-                row += [t.original_currency or "",
-                        t.original_amount if t.original_amount is not None else ""]
-            ws_cat.append(row)
-
-        last_row = ws_cat.max_row + 1
-        ws_cat.cell(row=last_row, column=3, value="TOTAL").font = Font(bold=True)
-        ws_cat.cell(row=last_row, column=4, value=f"=SUM(D2:D{last_row-1})").font = Font(bold=True)
+        total = f"=SUM(D2:D{len(cat_transactions) + 1})"
+        widths = cat_widths.get(cat, [])
+        measure(widths, cat_headers)
+        measure(widths, (None, None, "TOTAL", total))
+        write_rows(ws_cat, widths[:len(cat_headers)],
+                   category_rows(ws_cat, cat_headers, cat_transactions, cat_foreign, total))
 
     # ── Foreign currency sheets (one per currency) ──────────────
+    def currency_rows(ws_fc, fc_headers, fc_transactions, totals_row):
+        yield header_row(ws_fc, fc_headers)
+        for i, t in enumerate(fc_transactions, 1):
+            day, clock = stamps[id(t)]
+            row_style = "Budget Add" if t.action == "add" else "Budget Spend"
+            orig_amt = t.original_amount if t.action == "add" else -t.original_amount
+            conv_amt = t.amount          if t.action == "add" else -t.amount
+            row = [i, day, clock,
+                   t.category, t.action.capitalize(), orig_amt, conv_amt, t.note or ""]
+            yield [named(ws_fc, val, row_style) for val in row]
+        yield [None, None, None, None] + [styled(ws_fc, v, bold_font) for v in totals_row]
+
     for fc in foreign_currencies:
         fc_sym  = CURRENCIES.get(fc, {}).get('symbol', fc)
         ws_fc   = wb.create_sheet(title=f"{fc} Transactions"[:31])
         fc_headers = ["#", "Date", "Time", "Category", "Action",
                       f"Orig. Amount ({fc_sym})", f"Conv. Amount ({cur_sym})", "Note"]
 
-        for col, h in enumerate(fc_headers, 1):
-            cell = ws_fc.cell(row=1, column=col, value=h)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center")
-
-        fc_transactions = [t for t in transactions
-                           if t.original_currency == fc and t.original_amount is not None]
-
-        for i, t in enumerate(fc_transactions, 1):
-            dt       = datetime.fromisoformat(t.timestamp)
-            row_fill = add_fill if t.action == "add" else spend_fill
-            orig_amt = t.original_amount if t.action == "add" else -t.original_amount
-            conv_amt = t.amount          if t.action == "add" else -t.amount
-            row = [i, dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S"),
-                   t.category, t.action.capitalize(), orig_amt, conv_amt, t.note or ""]
-            for col, val in enumerate(row, 1):
-                cell = ws_fc.cell(row=i + 1, column=col, value=val)
-                cell.fill = row_fill
-                cell.font = Font(name="Segoe UI", size=10)
-
-        last_row = ws_fc.max_row + 1
-        ws_fc.cell(row=last_row, column=5, value="TOTAL").font = Font(bold=True)
-        ws_fc.cell(row=last_row, column=6, value=f"=SUM(F2:F{last_row-1})").font = Font(bold=True)
-        ws_fc.cell(row=last_row, column=7, value=f"=SUM(G2:G{last_row-1})").font = Font(bold=True)
-
-    # Auto-width for all sheets
-    for sheet in wb.worksheets:
-        for col in sheet.columns:
-            max_len = max((len(str(c.value or "")) for c in col), default=0)
-            sheet.column_dimensions[col[0].column_letter].width = min(max_len + 4, 40)
+        last_row = len(by_fc[fc]) + 1
+        totals_row = ("TOTAL", f"=SUM(F2:F{last_row})", f"=SUM(G2:G{last_row})")
+        widths = fc_widths[fc]
+        measure(widths, fc_headers)
+        measure(widths, (None, None, None, None) + totals_row)
+        write_rows(ws_fc, widths, currency_rows(ws_fc, fc_headers, by_fc[fc], totals_row))
 
     wb.save(output_path)
     return output_path
\ No newline at end of file